@@ -16,6 +16,7 @@ from __future__ import annotations
 import math
 import argparse
 import sys
+from functools import lru_cache
 from typing import List, Tuple, Optional
 import re
 
@@ -107,6 +108,23 @@ def qualification_points(rank: int, teams: int, alpha: float = 1.07) -> int:
     scaled = inv * (7 / denom) + 9
     return math.ceil(scaled)
 
+@lru_cache(maxsize=256)
+def qualification_points_table(teams: int, alpha: float = 1.07) -> Tuple[int, ...]:
+    """Qualification points for every rank 1..teams at one event size (index 0 is rank 1)."""
+    return tuple(qualification_points(rank, teams, alpha) for rank in range(1, teams + 1))
+
+def qualification_points_batch(ranks, teams: int, alpha: float = 1.07) -> List[int]:
+    """qualification_points for many ranks at the same event; the erfinv work is done once per event size."""
+    if teams < 2:
+        raise ValueError("Number of teams must be >= 2")
+    table = qualification_points_table(teams, alpha)
+    points = []
+    for rank in ranks:
+        if rank < 1 or rank > teams:
+            raise ValueError("Rank must be between 1 and number of teams")
+        points.append(table[rank - 1])
+    return points
+
 # --------------------------
 # Points by category
 # --------------------------
@@ -382,6 +400,41 @@ def compute_points_from_args(args: argparse.Namespace):
     total = sum(p for _, p, _ in breakdown)
     return breakdown, total
 
+def rank_from_snapshot(args: argparse.Namespace) -> None:
+    """Fill in --rank/--teams from a Season_Snapshot file when they were not given."""
+    if args.team is None or args.event is None:
+        print(FG_RED + "--snapshot needs --team and --event." + STYLE_RESET)
+        sys.exit(1)
+    from Season_Snapshot import SeasonSnapshot
+    with SeasonSnapshot(args.snapshot) as snapshot:
+        found = snapshot.team_rank(args.team, args.event)
+    if found is None:
+        print(FG_RED + f"Team {args.team} has no rank at {args.event} in {args.snapshot}." + STYLE_RESET)
+        sys.exit(1)
+    rank, teams = found
+    if args.rank is None:
+        args.rank = rank
+    if args.teams is None:
+        args.teams = teams
+
+def rank_from_matches(args: argparse.Namespace) -> None:
+    """Fill in --rank/--teams from the event's live match results (--year without --snapshot)."""
+    if args.team is None or args.event is None:
+        print(FG_RED + "--year needs --team and --event." + STYLE_RESET)
+        sys.exit(1)
+    from Ftc_stats import get_event_matches, get_event_teams
+    from Ranking_Engine import QualificationRanking
+    teams = [t['teamNumber'] for t in get_event_teams(args.event, args.year)]
+    ranking = QualificationRanking.from_matches(get_event_matches(args.event, args.year), teams)
+    rank = ranking.rank(args.team)
+    if rank is None:
+        print(FG_RED + f"Team {args.team} is not at {args.event} ({args.year})." + STYLE_RESET)
+        sys.exit(1)
+    if args.rank is None:
+        args.rank = rank
+    if args.teams is None:
+        args.teams = len(ranking)
+
 def main():
     parser = argparse.ArgumentParser(description="FTC Advancement Points Calculator with PDF export")
     parser.add_argument("--rank", type=int, help="Qualification rank (R)")
@@ -392,8 +445,17 @@ def main():
     parser.add_argument("--playoff", type=int, choices=[0,1,2,3,4], default=0, help="Playoff place (1..4), 0 if none")
     parser.add_argument("--award", action='append', nargs=2, metavar=('TYPE', 'PLACE'),
                         help="Judged award (e.g. inspire 1). Can be repeated.")
+    parser.add_argument("--snapshot", help="Season snapshot file to read rank and team count from")
+    parser.add_argument("--year", type=int, help="Season to rank --event from live match results")
+    parser.add_argument("--team", type=int, help="Team number to look up in --snapshot or --year")
+    parser.add_argument("--event", help="Event code to look up in --snapshot or --year")
     args = parser.parse_args()
 
+    if args.snapshot:
+        rank_from_snapshot(args)
+    elif args.year:
+        rank_from_matches(args)
+
     if len(sys.argv) == 1:
         # Interactive mode
         user_args = interactive_mode()
@@ -0,0 +1,243 @@
+import argparse
+import json
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import requests
+
+FTCSCOUT_REST = "https://api.ftcscout.org/rest/v1"
+CHECKPOINT = "checkpoint.log"
+RETRIES = 3
+
+
+# === UNITS ===
+# A unit is one upstream request, keyed "<season>/<kind>/<id>". Its JSON lands in
+# <store>/<key>.json and the key is appended to the checkpoint once the file is written.
+def unit_path(key):
+    season, kind, *rest = key.split('/')
+    if kind == 'events':
+        return f"/events/search/{season}", None
+    if kind == 'matches':
+        return f"/events/{season}/{rest[0]}/matches", None
+    if kind == 'event_teams':
+        return f"/events/{season}/{rest[0]}/teams", None
+    if kind == 'quick_stats':
+        return f"/teams/{rest[0]}/quick-stats", {'season': season}
+    raise ValueError(f"Unknown unit {key}")
+
+
+def unit_children(key, data):
+    season, kind, *_ = key.split('/')
+    if kind == 'events':
+        codes = [event['code'] for event in data]
+        return [f"{season}/matches/{code}" for code in codes] + [f"{season}/event_teams/{code}" for code in codes]
+    if kind == 'event_teams':
+        return [f"{season}/quick_stats/{p['teamNumber']}" for p in data]
+    return []
+
+
+class Backfill:
+    def __init__(self, store, base_url=FTCSCOUT_REST, workers=8, report_every=5.0):
+        self.store = store
+        self.base_url = base_url.rstrip('/')
+        self.workers = workers
+        self.report_every = report_every
+        self.checkpoint_path = os.path.join(store, CHECKPOINT)
+        self.done = set()
+        self.failed = {}
+        self.fetched = 0
+        self.bytes = 0
+        self._local = threading.local()
+        self._checkpoint_lock = threading.Lock()
+        if os.path.exists(self.checkpoint_path):
+            with open(self.checkpoint_path) as f:
+                self.done = {line.strip() for line in f if line.strip()}
+
+    def _session(self):
+        if not hasattr(self._local, 'session'):
+            self._local.session = requests.Session()
+        return self._local.session
+
+    def _file(self, key):
+        return os.path.join(self.store, *key.split('/')) + ".json"
+
+    def fetch(self, key):
+        path, params = unit_path(key)
+        for attempt in range(RETRIES):
+            try:
+                response = self._session().get(self.base_url + path, params=params, timeout=30)
+                if response.status_code == 404:
+                    return None, 0
+                response.raise_for_status()
+                return response.json(), len(response.content)
+            except (requests.RequestException, ValueError):
+                if attempt == RETRIES - 1:
+                    raise
+                time.sleep(2 ** attempt)
+
+    def _complete(self, key, data):
+        target = self._file(key)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        tmp = target + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp, target)
+        with self._checkpoint_lock, open(self.checkpoint_path, "a") as f:
+            f.write(key + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self.done.add(key)
+
+    def load(self, key):
+        with open(self._file(key)) as f:
+            return json.load(f)
+
+    def run(self, seasons):
+        os.makedirs(self.store, exist_ok=True)
+        queue = deque(f"{season}/events/all" for season in seasons)
+        seen = set(queue)
+        start = last_report = time.perf_counter()
+        skipped = 0
+
+        def enqueue(children):
+            for child in children:
+                if child not in seen:
+                    seen.add(child)
+                    queue.append(child)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            running = {}
+            while queue or running:
+                # Keep the pool fed without materialising every unit as a future up front
+                while queue and len(running) < self.workers * 2:
+                    key = queue.popleft()
+                    if key in self.done:
+                        skipped += 1
+                        enqueue(unit_children(key, self.load(key) or []))
+                        continue
+                    running[pool.submit(self.fetch, key)] = key
+                if not running:
+                    continue
+                finished, _ = wait(running, timeout=self.report_every, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    key = running.pop(future)
+                    try:
+                        data, size = future.result()
+                    except Exception as exc:
+                        self.failed[key] = repr(exc)
+                        continue
+                    self._complete(key, data)
+                    self.fetched += 1
+                    self.bytes += size
+                    enqueue(unit_children(key, data or []))
+                now = time.perf_counter()
+                if now - last_report >= self.report_every:
+                    last_report = now
+                    print(self.progress(now - start, skipped, len(queue) + len(running)))
+        elapsed = time.perf_counter() - start
+        return {'fetched': self.fetched, 'skipped': skipped, 'failed': len(self.failed),
+                'bytes': self.bytes, 'seconds': elapsed, 'units_per_second': self.fetched / elapsed if elapsed else 0.0}
+
+    def progress(self, elapsed, skipped, pending):
+        rate = self.fetched / elapsed if elapsed else 0.0
+        return (f"{self.fetched} fetched, {skipped} already done, {pending} pending, {len(self.failed)} failed"
+                f" | {rate:.1f} units/s, {self.bytes / 1e6:.1f} MB")
+
+
+def load_season(store, season):
+    """Read a backfilled season back as (events, participations, matches_by_event, quick_stats)."""
+    def read(*parts):
+        path = os.path.join(store, str(season), *parts)
+        if not os.path.exists(path):
+            return None
+        with open(path) as f:
+            return json.load(f)
+
+    events = read('events', 'all.json') or []
+    codes = [event['code'] for event in events]
+    participations = [p for code in codes for p in read('event_teams', f"{code}.json") or []]
+    matches_by_event = {code: read('matches', f"{code}.json") or [] for code in codes}
+    quick_stats = {p['teamNumber']: read('quick_stats', f"{p['teamNumber']}.json") for p in participations}
+    return events, participations, matches_by_event, quick_stats
+
+
+# === LOCAL FIXTURE SERVER ===
+class FixtureServer:
+    """
+    Serves canned ftcscout REST responses for tests and offline runs.
+    `fixtures` maps a path with query string (e.g. "/teams/1/quick-stats?season=2024") to a JSON value;
+    unknown paths return 404. `fail_every` makes every n-th request fail with 500.
+    """
+
+    def __init__(self, fixtures, host="127.0.0.1", port=0, fail_every=0):
+        self.fixtures = fixtures
+        self.fail_every = fail_every
+        self.requests = 0
+        server = self
+        lock = threading.Lock()
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with lock:
+                    server.requests += 1
+                    count = server.requests
+                parts = urlsplit(self.path)
+                path = parts.path[len("/rest/v1"):] if parts.path.startswith("/rest/v1") else parts.path
+                key = f"{path}?{parts.query}" if parts.query else path
+                if server.fail_every and count % server.fail_every == 0:
+                    self.send_error(500)
+                    return
+                if key not in server.fixtures:
+                    self.send_error(404)
+                    return
+                body = json.dumps(server.fixtures[key]).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer((host, port), Handler)
+        self.url = f"http://{host}:{self._httpd.server_address[1]}/rest/v1"
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resumable multi-season ftcscout backfill")
+    parser.add_argument("--from", dest='first', type=int, required=True, help="First season (e.g. 2019)")
+    parser.add_argument("--to", dest='last', type=int, required=True, help="Last season (inclusive)")
+    parser.add_argument("--store", default="ftc_store", help="Output directory (default ftc_store)")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent requests (default 8)")
+    parser.add_argument("--base-url", default=FTCSCOUT_REST, help="REST API root, e.g. a local fixture server")
+    args = parser.parse_args()
+
+    backfill = Backfill(args.store, args.base_url, args.workers)
+    try:
+        summary = backfill.run(range(args.first, args.last + 1))
+    except KeyboardInterrupt:
+        print(f"\nInterrupted; {len(backfill.done)} units checkpointed. Run again to resume.")
+        raise SystemExit(130)
+    for key, error in backfill.failed.items():
+        print(f"Failed {key}: {error}")
+    print(f"\n✅ {summary['fetched']} units fetched, {summary['skipped']} resumed, {summary['failed']} failed "
+          f"in {summary['seconds']:.1f}s ({summary['units_per_second']:.1f} units/s, {summary['bytes'] / 1e6:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+import numpy as np
+import pandas as pd
+
+# Declarative projections of ftcscout REST payloads.
+# Each schema maps an output column to (dotted path in the JSON record, dtype).
+# dtype is a NumPy dtype for numeric columns, 'Int64' for nullable integers,
+# object for strings, or 'datetime'.
+
+# /teams/{team}/events/{year} and /events/{year}/{code}/teams
+TEAM_EVENT_STATS = {
+    'Total': ('stats.avg.totalPoints', np.float64),
+    'Auto Avg': ('stats.avg.autoPoints', np.float64),
+    'DC Avg': ('stats.avg.dcPoints', np.float64),
+    'Rank': ('stats.rank', np.float64),
+    'Event': ('eventCode', object),
+    'Updated': ('updatedAt', 'datetime'),
+}
+
+TEAM_EVENT_PARTICIPATION = {
+    'Team': ('teamNumber', 'Int64'),
+    **TEAM_EVENT_STATS,
+}
+
+# /teams/{team}/quick-stats
+QUICK_STATS = {
+    'Total OPR': ('tot.value', np.float64),
+    'Auto OPR': ('auto.value', np.float64),
+    'DC OPR': ('dc.value', np.float64),
+    'Total Rank': ('tot.rank', np.float64),
+    'Auto Rank': ('auto.rank', np.float64),
+    'DC Rank': ('dc.rank', np.float64),
+    'Teams': ('count', np.float64),
+}
+
+# /teams/{team} and /teams/search
+TEAM = {
+    'Number': ('number', 'Int64'),
+    'Name': ('name', object),
+    'City': ('city', object),
+    'State': ('state', object),
+    'Country': ('country', object),
+    'Rookie Year': ('rookieYear', 'Int64'),
+}
+
+# /events/search/{year}
+EVENT = {
+    'Code': ('code', object),
+    'Name': ('name', object),
+    'Start': ('start', 'datetime'),
+    'Region': ('regionCode', object),
+    'Type': ('type', object),
+}
+
+# 'teams' entries of /events/{year}/{code}/matches
+MATCH_TEAMS = {
+    'matchId': ('matchId', 'Int64'),
+    'alliance': ('alliance', object),
+    'teamNumber': ('teamNumber', 'Int64'),
+    'surrogate': ('surrogate', object),
+}
+
+
+def _getter(path):
+    keys = path.split('.')
+
+    def get(record):
+        for key in keys:
+            try:
+                record = record[key]
+            except (KeyError, TypeError):
+                return None
+        return record
+
+    return get
+
+
+def _column(records, path, dtype):
+    get = _getter(path)
+    if dtype is object:
+        return np.array([get(r) for r in records], dtype=object)
+    if dtype == 'datetime':
+        return pd.to_datetime([get(r) for r in records], utc=True)
+    if dtype == 'Int64':
+        return pd.array([get(r) for r in records], dtype='Int64')
+    nan = np.nan
+    return np.fromiter(((nan if v is None else v) for v in map(get, records)), dtype=dtype, count=len(records))
+
+
+def project(records, schema, columns=None):
+    """
+    Extract only the schema's paths from a list of JSON records into a typed DataFrame.
+    Missing paths (e.g. events without stats) become NaN/None instead of raising.
+    """
+    columns = columns or list(schema)
+    return pd.DataFrame({name: _column(records, *schema[name]) for name in columns})
+
+
+def project_nested(records, record_path, schema, columns=None):
+    """Like project, over the list found at record_path in each record (as pd.json_normalize(data, record_path))."""
+    get = _getter(record_path)
+    nested = [item for record in records for item in (get(record) or [])]
+    return project(nested, schema, columns)
+
+
+def match_team_rows(matches_by_event):
+    """
+    One row per team per match from /events/{year}/{code}/matches payloads, with that
+    team's alliance score breakdown and the opposing total.
+    """
+    rows = []
+    for event_code, matches in matches_by_event.items():
+        for match in matches:
+            scores = match.get('scores') or {}
+            for team in match.get('teams') or []:
+                alliance = team['alliance']
+                mine = scores.get(alliance.lower()) or {}
+                theirs = scores.get('blue' if alliance == 'Red' else 'red') or {}
+                rows.append((event_code, match.get('id', match.get('matchNum')), match.get('tournamentLevel'),
+                             team['teamNumber'], alliance, bool(team.get('surrogate')),
+                             mine.get('totalPoints'), mine.get('autoPoints'), mine.get('dcPoints'),
+                             theirs.get('totalPoints')))
+    df = pd.DataFrame(rows, columns=['Event', 'Match', 'Level', 'Team', 'Alliance', 'Surrogate',
+                                     'Score', 'Auto', 'DC', 'Opp Score'])
+    for column in ('Score', 'Auto', 'DC', 'Opp Score'):
+        df[column] = df[column].astype(np.float64)
+    return df
@@ -1,155 +1,246 @@
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 import matplotlib.pyplot as plt
 import pandas as pd
+import numpy as np
 import requests
 
-while True:
-
-    option = input("1 - All Event Stats for a Team\n"
-                   "2 - Just Team Stats\n"
-                   "3 - Show with who did a Team play in a certain Event\n"
-                   "4 - Plot scores from events\n"
-                   "5 - Compare 2 teams\n"
-                   "Enter option: ")
-
-    if option == "1":
-        team_id = input("Enter team ID: ")
-        year = input("Enter year: ")
-        url1 = f"https://api.ftcscout.org/rest/v1/teams/{team_id}/events/{year}"
-        response = requests.get(url1)
-
-        data = response.json()
-
-        df = pd.DataFrame(data)
-        df = pd.json_normalize(data)
-        pd.set_option('display.max_columns', None)
-        excel = "TeamStats.xlsx"
-        df.to_excel(excel, index=False)
-        df = df[['stats.avg.totalPoints', 'stats.avg.autoPoints', 'stats.avg.dcPoints', 'stats.rank', 'eventCode']]
-        df = df.rename(columns={'stats.avg.totalPoints': 'Total', 'stats.avg.autoPoints': 'Auto Avg', 'stats.avg.dcPoints': 'DC Avg', 'stats.rank': 'Rank', 'eventCode': 'Event'})
-
-        print(df)
-
-
-    if option == "2":
-        team_id = input("Enter team ID: ")
-        url2 = f"https://api.ftcscout.org/rest/v1/teams/{team_id}/quick-stats"
-        response = requests.get(url2)
-        data = response.json()
-
-        df = pd.DataFrame(data)
-        df = pd.json_normalize(data)
-
-        pd.set_option('display.max_columns', None)
-        print(df)
-
-    if option == "3":
-        team_id = int(input("Enter team ID: "))
-        year = input("Enter year: ")
-        url4 = f"https://api.ftcscout.org/rest/v1/teams/{team_id}/events/{year}"
-        responsee = requests.get(url4)
-        data2 = responsee.json()
-        dfe = pd.DataFrame(data2)
-        dfe = pd.json_normalize(data2)
-        dfe = dfe[['eventCode']]
-        dfe.rename(columns={'eventCode': 'Event'}, inplace=True)
-        print(dfe)
-
-        eventCode = int(input("Enter event code: "))
-        url3 = f"https://api.ftcscout.org/rest/v1/events/{year}/{dfe.iloc[eventCode]['Event']}/matches"
-        response = requests.get(url3)
-        data1 = response.json()
-
-        df = pd.DataFrame(data1)
-        df = pd.json_normalize(data1, 'teams')
-        df = df[['matchId', 'alliance', 'teamNumber']]
-        pd.set_option('display.max_rows', None)
-        Matches = df[df['teamNumber'] == team_id]
-        alliance = Matches['alliance']
-        match_id = Matches['matchId']
-        filter = list(zip(match_id, alliance))
-        match = df[(df[['matchId', 'alliance']].apply(tuple, axis=1).isin(filter)) & (df['teamNumber'] != team_id)]
-        match = match[['teamNumber']]
-        Matches.insert(3, "Team_two", match['teamNumber'].values)
-
-        Names = []
-        team2 = 0
-
-        for i in range(0, len(match.index)):
-            team2 = match.iloc[i]['teamNumber']
-            url5 = f"https://api.ftcscout.org/rest/v1/teams/{team2}"
-            responseName = requests.get(url5)
-            data2 = responseName.json()
-            dfN = pd.DataFrame(data2)
-            dfN = pd.json_normalize(data2)
-            dfN = dfN[['name']]
-            Names.append(dfN['name'].tolist())
-        Matches.insert(4, "Team_two_name", Names)
-        print(Matches)
-
-    if option == "4":
-        team_id = input("Enter team ID: ")
-        year = input("Enter year: ")
-        url1 = f"https://api.ftcscout.org/rest/v1/teams/{team_id}/events/{year}"
-        response = requests.get(url1)
-        data = response.json()
-        df = pd.DataFrame(data)
-        df = pd.json_normalize(data)
-        df = df.iloc[::-1]
-        df = df[['stats.avg.totalPoints', 'stats.avg.autoPoints', 'stats.avg.dcPoints', 'stats.rank', 'eventCode']]
-        df = df.rename(columns={'stats.avg.totalPoints': 'Total', 'stats.avg.autoPoints': 'Auto Avg', 'stats.avg.dcPoints': 'DC Avg', 'stats.rank': 'Rank', 'eventCode': 'Event'})
-        plt.plot(df['Event'], df['Total'], label='Total')
-        plt.plot(df['Event'], df['Auto Avg'], label='Auto Avg')
-        plt.plot(df['Event'], df['DC Avg'], label='DC Avg')
-        plt.legend()
-        plt.xlabel("Event")
-        plt.ylabel("Points")
-        plt.show()
-
-    if option == "5":
-        team_id = input("Enter team ID: ")
-        team_id2 = input("Enter team ID for team 2: ")
-        year = input("Enter year: ")
-        url1 = f"https://api.ftcscout.org/rest/v1/teams/{team_id}/events/{year}"
-        response = requests.get(url1)
-        data = response.json()
-        df = pd.DataFrame(data)
-        df = pd.json_normalize(data)
-        #df = df.iloc[::-1]
-        df = df[['stats.avg.totalPoints', 'stats.avg.autoPoints', 'stats.avg.dcPoints', 'stats.rank', 'eventCode', 'updatedAt']]
-        df = df.rename(columns={'stats.avg.totalPoints': 'Total', 'stats.avg.autoPoints': 'Auto Avg', 'stats.avg.dcPoints': 'DC Avg', 'stats.rank': 'Rank', 'eventCode': 'Event', 'updatedAt': 'Updated'})
-        df.sort_values(by=['Updated'], ascending=True, inplace=True, ignore_index=True)
-
-        plt.plot(df.index, df['Total'], label=f'Total {team_id}')
-        plt.plot(df.index, df['Auto Avg'], label=f'Auto Avg {team_id}')
-        plt.plot(df.index, df['DC Avg'], label=f'DC Avg {team_id}')
-
-
-        url1_2 = f"https://api.ftcscout.org/rest/v1/teams/{team_id2}/events/{year}"
-        response2 = requests.get(url1_2)
-        data2 = response2.json()
-        df2 = pd.DataFrame(data2)
-        df2 = pd.json_normalize(data2)
-        #df2 = df2.iloc[::-1]
-        df2 = df2[['stats.avg.totalPoints', 'stats.avg.autoPoints', 'stats.avg.dcPoints', 'stats.rank', 'eventCode', 'updatedAt']]
-        df2 = df2.rename(columns={'stats.avg.totalPoints': 'Total', 'stats.avg.autoPoints': 'Auto Avg', 'stats.avg.dcPoints': 'DC Avg', 'stats.rank': 'Rank', 'eventCode': 'Event', 'updatedAt': 'Updated'})
-        df2.sort_values(by=['Updated'], ascending=True, inplace=True, ignore_index=True)
-        
-        print(df)
-        print(df2)
-
-        plt.plot(df2.index, df2['Total'], linestyle = ':', label=f'Total {team_id2}')
-        plt.plot(df2.index, df2['Auto Avg'], linestyle = ':', label=f'Auto Avg {team_id2}')
-        plt.plot(df2.index, df2['DC Avg'], linestyle = ':', label=f'DC Avg {team_id2}')
-
-        plt.legend()
-        plt.xlabel("Event")
-        plt.ylabel("Points")
-        plt.show()
-
-
-    time.sleep(5)
-
-    print('\n\n')
-
+from Ftc_Schemas import MATCH_TEAMS, QUICK_STATS, TEAM, TEAM_EVENT_STATS, match_team_rows, project, project_nested
+from Match_Trends import match_series, plot_team_trends, rolling_trends
+from Team_Search import ask_team, ask_teams
 
+# Columns shown for a team's events in options 1 and 4
+EVENT_COLUMNS = ['Total', 'Auto Avg', 'DC Avg', 'Rank', 'Event']
+
+
+def get_team_events(team_id, year, session=requests):
+    url = f"https://api.ftcscout.org/rest/v1/teams/{team_id}/events/{year}"
+    response = session.get(url)
+    if response.status_code == 200:
+        return response.json()
+    return []
+
+
+def get_team(team_id, session=requests):
+    url = f"https://api.ftcscout.org/rest/v1/teams/{team_id}"
+    response = session.get(url)
+    if response.status_code == 200:
+        return response.json()
+    return None
+
+
+def get_season_events(year, session=requests):
+    url = f"https://api.ftcscout.org/rest/v1/events/search/{year}"
+    response = session.get(url)
+    if response.status_code == 200:
+        return response.json()
+    return []
+
+
+def get_event_matches(event_code, year, session=requests):
+    url = f"https://api.ftcscout.org/rest/v1/events/{year}/{event_code}/matches"
+    response = session.get(url)
+    if response.status_code == 200:
+        return response.json()
+    return []
+
+
+def get_event_teams(event_code, year, session=requests):
+    url = f"https://api.ftcscout.org/rest/v1/events/{year}/{event_code}/teams"
+    response = session.get(url)
+    if response.status_code == 200:
+        return response.json()
+    return []
+
+
+def get_team_quick_stats(team_id, year, session=requests):
+    url = f"https://api.ftcscout.org/rest/v1/teams/{team_id}/quick-stats"
+    response = session.get(url, params={'season': year})
+    if response.status_code == 200:
+        return response.json()
+    return None
+
+
+def search_teams(session=requests, **params):
+    url = "https://api.ftcscout.org/rest/v1/teams/search"
+    response = session.get(url, params={'limit': 100000, **params})
+    if response.status_code == 200:
+        return response.json()
+    return []
+
+
+def fetch_concurrently(keys, fetch, max_workers=16):
+    # One request per key, all in flight at once, sharing a connection pool
+    keys = list(keys)
+    if not keys:
+        return {}
+    workers = min(max_workers, len(keys))
+    with requests.Session() as session, ThreadPoolExecutor(max_workers=workers) as pool:
+        session.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=workers))
+        results = pool.map(lambda key: fetch(key, session), keys)
+        return dict(zip(keys, results))
+
+
+def get_teams_events(team_ids, year, max_workers=16):
+    return fetch_concurrently(team_ids, lambda team, session: get_team_events(team, year, session), max_workers)
+
+
+def get_season_matches(year, event_codes=None, max_workers=16):
+    if event_codes is None:
+        event_codes = [event['code'] for event in get_season_events(year)]
+    return fetch_concurrently(event_codes, lambda code, session: get_event_matches(code, year, session), max_workers)
+
+
+def normalize_teams_events(events_by_team):
+    # Long format: one row per (team, event), all teams normalized in one pass
+    records = [event for events in events_by_team.values() for event in events]
+    df = project(records, TEAM_EVENT_STATS)
+    teams = [str(team) for team in events_by_team]
+    df.insert(0, 'Team', np.repeat(teams, [len(events) for events in events_by_team.values()]))
+    df.sort_values(by=['Updated', 'Team'], ascending=True, inplace=True, ignore_index=True)
+    df.insert(1, 'Event No', df.groupby('Team').cumcount())
+    return df
+
+
+def plot_teams_comparison(df, ax=None):
+    ax = ax or plt.gca()
+    colors = plt.rcParams['axes.prop_cycle'].by_key()['color']
+    styles = {'Total': '-', 'Auto Avg': '--', 'DC Avg': ':'}
+    for i, (team, team_df) in enumerate(df.groupby('Team', sort=False)):
+        for column, linestyle in styles.items():
+            ax.plot(team_df['Updated'], team_df[column], marker='o', linestyle=linestyle,
+                    color=colors[i % len(colors)], label=f'{column} {team}')
+    ax.legend(fontsize='small', ncol=1 + len(ax.lines) // 20)
+    ax.set_xlabel("Event date")
+    ax.set_ylabel("Points")
+    return ax
+
+
+def main():
+    # FTC_SNAPSHOT points at a Season_Snapshot file to answer comparisons without the network
+    snapshot = None
+    if os.environ.get("FTC_SNAPSHOT"):
+        from Season_Snapshot import SeasonSnapshot
+        snapshot = SeasonSnapshot(os.environ["FTC_SNAPSHOT"])
+
+    while True:
+
+        option = input("1 - All Event Stats for a Team\n"
+                       "2 - Just Team Stats\n"
+                       "3 - Show with who did a Team play in a certain Event\n"
+                       "4 - Plot scores from events\n"
+                       "5 - Compare teams\n"
+                       "6 - Plot per-match trends\n"
+                       "Enter option: ")
+
+        if option == "1":
+            team_id = ask_team()
+            year = input("Enter year: ")
+            url1 = f"https://api.ftcscout.org/rest/v1/teams/{team_id}/events/{year}"
+            response = requests.get(url1)
+
+            data = response.json()
+
+            pd.set_option('display.max_columns', None)
+            # The spreadsheet is the full dump; the printed table only needs the stats columns
+            excel = "TeamStats.xlsx"
+            pd.json_normalize(data).to_excel(excel, index=False)
+            df = project(data, TEAM_EVENT_STATS, EVENT_COLUMNS)
+
+            print(df)
+
+
+        if option == "2":
+            team_id = ask_team()
+            # No season given: ftcscout answers with the current season's quick stats
+            data = get_team_quick_stats(team_id, None)
+            df = project([data] if data else [], QUICK_STATS)
+
+            pd.set_option('display.max_columns', None)
+            print(df)
+
+        if option == "3":
+            team_id = ask_team()
+            year = input("Enter year: ")
+            url4 = f"https://api.ftcscout.org/rest/v1/teams/{team_id}/events/{year}"
+            responsee = requests.get(url4)
+            data2 = responsee.json()
+            dfe = project(data2, TEAM_EVENT_STATS, ['Event'])
+            print(dfe)
+
+            eventCode = int(input("Enter event code: "))
+            url3 = f"https://api.ftcscout.org/rest/v1/events/{year}/{dfe.iloc[eventCode]['Event']}/matches"
+            response = requests.get(url3)
+            data1 = response.json()
+
+            df = project_nested(data1, 'teams', MATCH_TEAMS, ['matchId', 'alliance', 'teamNumber'])
+            pd.set_option('display.max_rows', None)
+            Matches = df[df['teamNumber'] == team_id]
+            alliance = Matches['alliance']
+            match_id = Matches['matchId']
+            filter = list(zip(match_id, alliance))
+            match = df[(df[['matchId', 'alliance']].apply(tuple, axis=1).isin(filter)) & (df['teamNumber'] != team_id)]
+            match = match[['teamNumber']]
+            Matches.insert(3, "Team_two", match['teamNumber'].values)
+
+            Names = []
+            team2 = 0
+
+            for i in range(0, len(match.index)):
+                team2 = match.iloc[i]['teamNumber']
+                url5 = f"https://api.ftcscout.org/rest/v1/teams/{team2}"
+                responseName = requests.get(url5)
+                data2 = responseName.json()
+                dfN = project([data2], TEAM, ['Name'])
+                Names.append(dfN['Name'].tolist())
+            Matches.insert(4, "Team_two_name", Names)
+            print(Matches)
+
+        if option == "4":
+            team_id = ask_team()
+            year = input("Enter year: ")
+            url1 = f"https://api.ftcscout.org/rest/v1/teams/{team_id}/events/{year}"
+            response = requests.get(url1)
+            data = response.json()
+            df = project(data, TEAM_EVENT_STATS, EVENT_COLUMNS)
+            df = df.iloc[::-1]
+            plt.plot(df['Event'], df['Total'], label='Total')
+            plt.plot(df['Event'], df['Auto Avg'], label='Auto Avg')
+            plt.plot(df['Event'], df['DC Avg'], label='DC Avg')
+            plt.legend()
+            plt.xlabel("Event")
+            plt.ylabel("Points")
+            plt.show()
+
+        if option == "5":
+            team_ids = [str(team) for team in ask_teams()]
+            year = input("Enter year: ")
+            if snapshot and str(snapshot.meta.get('season')) == year:
+                df = snapshot.team_events(team_ids)
+            else:
+                df = normalize_teams_events(get_teams_events(team_ids, year))
+            pd.set_option('display.max_rows', None)
+            print(df)
+            plot_teams_comparison(df)
+            plt.show()
+
+        if option == "6":
+            team_id = ask_team()
+            year = input("Enter year: ")
+            events = project(get_team_events(team_id, year), TEAM_EVENT_STATS, ['Event', 'Updated'])
+            rows = match_team_rows(get_season_matches(year, events['Event'].tolist()))
+            rows = rows[rows['Team'] == team_id]
+            trends = rolling_trends(match_series(rows, dict(zip(events['Event'], events['Updated']))))
+            pd.set_option('display.max_rows', None)
+            print(trends[['Match No', 'Event', 'Match', 'Score', 'Score Avg', 'Score EWM', 'Score Trend']].round(2))
+            plot_team_trends(trends, team_id)
+            plt.show()
+
+        time.sleep(5)
+
+        print('\n\n')
+
+
+if __name__ == "__main__":
+    main()
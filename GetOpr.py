@@ -1,8 +1,17 @@
+import os
 import requests
 import pandas as pd
 import matplotlib.pyplot as plt
 from pandas.plotting import table as pd_table
 
+from Team_Search import ask_team
+
+# Optional Season_Snapshot file: OPRs are read from it instead of quick-stats requests
+snapshot = None
+if os.environ.get("FTC_SNAPSHOT"):
+    from Season_Snapshot import SeasonSnapshot
+    snapshot = SeasonSnapshot(os.environ["FTC_SNAPSHOT"])
+
 def get_team_name(team_number, cache):
     if team_number in cache:
         return cache[team_number]
@@ -18,6 +27,9 @@ def get_team_name(team_number, cache):
 def get_team_opr(team_number, year, cache):
     if team_number in cache:
         return cache[team_number]
+    if snapshot and str(snapshot.meta.get('season')) == str(year):
+        cache[team_number] = snapshot.opr(team_number)
+        return cache[team_number]
     url = f"https://api.ftcscout.org/rest/v1/teams/{team_number}/quick-stats?season={year}"
     response = requests.get(url)
     if response.status_code == 200:
@@ -32,7 +44,7 @@ def get_team_opr(team_number, year, cache):
     return {'Auto': 0, 'TeleOp': 0, 'Total': 0}
 
 
-team_id = int(input("Enter your team ID: "))
+team_id = ask_team("Enter your team ID or name: ")
 year = input("Enter year: ")
 
 # 1. Get all events for your team
@@ -3,6 +3,8 @@ import pandas as pd
 import matplotlib.pyplot as plt
 from pandas.plotting import table as pd_table
 
+from Team_Search import ask_team
+
 
 def get_team_name(team_number, cache):
     if team_number in cache:
@@ -16,7 +18,7 @@ def get_team_name(team_number, cache):
         return name
     return "Unknown"
 
-team_id = int(input("Enter your team ID: "))
+team_id = ask_team("Enter your team ID or name: ")
 year = input("Enter year: ")
 
 # 1. Get all events for your team
@@ -1,29 +1,31 @@
-import requests
 import pandas as pd
 import matplotlib.pyplot as plt
 from pandas.plotting import table as pd_table
 
+from GraphQL_Client import GraphQLClient, selection
+from Team_Search import ask_team
+
+# Fields the match report reads; the selection sets below are generated from these
+EVENT_FIELDS = ["eventCode"]
+MATCH_FIELDS = ["matchNum", "teams.teamNumber", "teams.alliance", "teams.team.name"]
+
+# Two dependent calls per run: nothing to batch, and a cold persisted hash would only add a round trip
+client = GraphQLClient()
+
 
 # === GRAPHQL REQUEST FUNCTION ===
 def graphql_query(query: str, variables: dict):
-    url = "https://api.ftcscout.org/graphql"
-    headers = {"Content-Type": "application/json"}
-    payload = {"query": query, "variables": variables}
-    response = requests.post(url, json=payload, headers=headers)
-    response.raise_for_status()
-    return response.json()
+    return client.execute(query, variables)
 
 
 # === GET EVENTS FOR TEAM ===
 def get_team_events(team_number: int, season: int):
-    query = """
-    query ($number: Int!, $season: Int!) {
-      teamByNumber(number: $number) {
-        events(season: $season) {
-          eventCode
-        }
-      }
-    }
+    query = f"""
+    query ($number: Int!, $season: Int!) {{
+      teamByNumber(number: $number) {{
+        events(season: $season) {{ {selection(EVENT_FIELDS)} }}
+      }}
+    }}
     """
     variables = {"number": team_number, "season": season}
     data = graphql_query(query, variables)
@@ -32,30 +34,41 @@ def get_team_events(team_number: int, season: int):
 
 # === GET MATCHES FOR EVENT ===
 def get_event_matches(event_code: str, season: int):
-    query = """
-    query ($season: Int!, $code: String!) {
-      eventByCode(season: $season, code: $code) {
-        matches {
-          matchNum
-          teams {
-            teamNumber
-            alliance
-            team {
-              name
-            }
-          }
-        }
-      }
-    }
+    query = f"""
+    query ($season: Int!, $code: String!) {{
+      eventByCode(season: $season, code: $code) {{
+        matches {{ {selection(MATCH_FIELDS)} }}
+      }}
+    }}
     """
     variables = {"season": season, "code": event_code}
     data = graphql_query(query, variables)
     return data["data"]["eventByCode"]["matches"]
 
 
+# === SAVE MATCH TABLE PDF ===
+def save_matches_pdf(df_results, filename: str):
+    fig, ax = plt.subplots(figsize=(8, 0.3 * len(df_results)))
+    ax.axis('off')
+
+    tbl = pd_table(ax, df_results, loc='center', cellLoc='center', colWidths=[0.3] * len(df_results.columns))
+    tbl.auto_set_font_size(False)
+    tbl.set_fontsize(10)
+
+    for key, cell in tbl.get_celld().items():
+        if key[0] == 0:
+            cell.set_text_props(weight='bold', color='white')
+            cell.set_facecolor('#4C72B0')
+        else:
+            cell.set_facecolor('#F5F5F5' if key[0] % 2 == 0 else '#FFFFFF')
+
+    fig.savefig(filename, bbox_inches='tight')
+    plt.close(fig)
+
+
 # === MAIN SCRIPT ===
 def main():
-    team_id = int(input("Enter your team ID: "))
+    team_id = ask_team("Enter your team ID or name: ")
     season = int(input("Enter season (e.g., 2024): "))
 
     # 1. Get all events
@@ -113,22 +126,8 @@ def main():
     print(df_results)
 
     # 6. Save to PDF
-    fig, ax = plt.subplots(figsize=(8, 0.3 * len(df_results)))
-    ax.axis('off')
-
-    tbl = pd_table(ax, df_results, loc='center', cellLoc='center', colWidths=[0.3] * len(df_results.columns))
-    tbl.auto_set_font_size(False)
-    tbl.set_fontsize(10)
-
-    for key, cell in tbl.get_celld().items():
-        if key[0] == 0:
-            cell.set_text_props(weight='bold', color='white')
-            cell.set_facecolor('#4C72B0')
-        else:
-            cell.set_facecolor('#F5F5F5' if key[0] % 2 == 0 else '#FFFFFF')
-
     filename = f"Team_{team_id}_{event_code}_Matches.pdf"
-    plt.savefig(filename, bbox_inches='tight')
+    save_matches_pdf(df_results, filename)
     print(f"\n✅ PDF saved as: {filename}")
 
 
@@ -0,0 +1,368 @@
+import hashlib
+import json
+import re
+import threading
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+FTCSCOUT_GRAPHQL = "https://api.ftcscout.org/graphql"
+PERSISTED_QUERY_NOT_FOUND = "PersistedQueryNotFound"
+
+
+# === SELECTION SETS ===
+def selection(fields):
+    """
+    Build a selection set from the dotted field paths a report reads, e.g.
+    ["matchNum", "teams.alliance", "teams.team.name"] -> "matchNum teams { alliance team { name } }"
+    """
+    tree = {}
+    for path in fields:
+        node = tree
+        for part in path.split('.'):
+            node = node.setdefault(part, {})
+
+    def render(node):
+        return " ".join(f"{name} {{ {render(child)} }}" if child else name for name, child in node.items())
+
+    return render(tree)
+
+
+# === DOCUMENT PARSING (just enough for batching and the local server) ===
+_NAME = re.compile(r"[_A-Za-z][_0-9A-Za-z]*")
+_OPERATION = re.compile(r"^\s*(?:query\b\s*(?:[_A-Za-z]\w*)?\s*)?(?:\((?P<defs>[^)]*)\))?\s*\{(?P<body>.*)\}\s*$", re.S)
+_ARGUMENT = re.compile(r'(\w+)\s*:\s*(\$\w+|"(?:[^"\\]|\\.)*"|[-\w.]+)')
+
+
+def _balanced(text, i, open_char, close_char):
+    depth = 0
+    in_string = False
+    for j in range(i, len(text)):
+        c = text[j]
+        if in_string:
+            if c == '\\':
+                continue
+            if c == '"' and text[j - 1] != '\\':
+                in_string = False
+        elif c == '"':
+            in_string = True
+        elif c == open_char:
+            depth += 1
+        elif c == close_char:
+            depth -= 1
+            if depth == 0:
+                return j + 1
+    raise ValueError(f"Unbalanced {open_char}{close_char} in GraphQL document")
+
+
+def split_fields(text):
+    """Split a selection set body into (alias, name, arguments, sub-selection) tuples."""
+    fields = []
+    i = 0
+    while i < len(text):
+        if text[i] in " \t\r\n,":
+            i += 1
+            continue
+        if text.startswith("...", i) or text[i] == '@':
+            raise ValueError("Fragments and directives are not supported")
+        match = _NAME.match(text, i)
+        if not match:
+            raise ValueError(f"Unexpected {text[i]!r} in GraphQL selection")
+        alias, name = None, match.group()
+        i = match.end()
+        while i < len(text) and text[i].isspace():
+            i += 1
+        if i < len(text) and text[i] == ':':
+            i += 1
+            while text[i].isspace():
+                i += 1
+            match = _NAME.match(text, i)
+            alias, name = name, match.group()
+            i = match.end()
+        arguments = sub = ""
+        while i < len(text) and text[i].isspace():
+            i += 1
+        if i < len(text) and text[i] == '(':
+            end = _balanced(text, i, '(', ')')
+            arguments, i = text[i + 1:end - 1], end
+        while i < len(text) and text[i].isspace():
+            i += 1
+        if i < len(text) and text[i] == '{':
+            end = _balanced(text, i, '{', '}')
+            sub, i = text[i + 1:end - 1], end
+        fields.append((alias, name, arguments, sub))
+    return fields
+
+
+def parse_operation(query):
+    match = _OPERATION.match(query)
+    if not match:
+        raise ValueError("Only anonymous or named query operations are supported")
+    return match.group('defs') or "", match.group('body')
+
+
+def merge_queries(requests_):
+    """
+    Merge (query, variables) pairs into one aliased document.
+    Returns the document, merged variables and, per request, {merged alias: original key}.
+    """
+    definitions, body, variables, keys = [], [], {}, []
+    for n, (query, query_variables) in enumerate(requests_):
+        defs, query_body = parse_operation(query)
+        prefix = f"q{n}_"
+        defs = re.sub(r"\$(\w+)", rf"${prefix}\1", defs)
+        if defs.strip():
+            definitions.append(defs)
+        mapping = {}
+        for alias, name, arguments, sub in split_fields(query_body):
+            key = alias or name
+            arguments = re.sub(r"\$(\w+)", rf"${prefix}\1", arguments)
+            sub = re.sub(r"\$(\w+)", rf"${prefix}\1", sub)
+            field = f"{prefix}{key}: {name}"
+            field += f"({arguments})" if arguments else ""
+            field += f" {{ {sub} }}" if sub else ""
+            body.append(field)
+            mapping[f"{prefix}{key}"] = key
+        variables.update({f"{prefix}{k}": v for k, v in (query_variables or {}).items()})
+        keys.append(mapping)
+    header = f"query ({', '.join(definitions)})" if definitions else "query"
+    return f"{header} {{ {' '.join(body)} }}", variables, keys
+
+
+def _split_response(response, keys):
+    results = []
+    errors = response.get('errors') or []
+    data = response.get('data') or {}
+    for mapping in keys:
+        result = {'data': {original: data.get(merged) for merged, original in mapping.items()}}
+        mine = [e for e in errors if not e.get('path') or e['path'][0] in mapping]
+        if mine:
+            result['errors'] = mine
+        results.append(result)
+    return results
+
+
+# === CLIENT ===
+class GraphQLClient:
+    """
+    Thread-safe GraphQL client.
+
+    - Identical in-flight queries (same text and variables) share one request.
+    - With batch_window > 0, queries issued within that many seconds of each other
+      are merged into one aliased document.
+    - With persisted=True, single queries are sent as sha256 hashes (automatic
+      persisted queries) and the text is only sent when the server has not seen it
+      yet. Merged batches always go as full text.
+    """
+
+    def __init__(self, url=FTCSCOUT_GRAPHQL, session=None, batch_window=0.0, max_batch=20, persisted=False):
+        self.url = url
+        self.session = session or requests.Session()
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.persisted = persisted
+        self.requests_sent = 0
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+        self._inflight = {}
+        self._pending = []
+        self._timer = None
+
+    def execute(self, query, variables=None):
+        return self.submit(query, variables).result()
+
+    def execute_many(self, queries):
+        """Run several (query, variables) pairs as a single batched request."""
+        futures = [self._singleflight(query, variables, defer=True) for query, variables in queries]
+        self._flush()
+        return [future.result() for future in futures]
+
+    def submit(self, query, variables=None):
+        return self._singleflight(query, variables, defer=self.batch_window > 0)
+
+    def _singleflight(self, query, variables, defer):
+        key = (query, json.dumps(variables or {}, sort_keys=True))
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return future
+            future = self._inflight[key] = Future()
+            if defer:
+                self._pending.append((key, query, variables))
+                if len(self._pending) >= self.max_batch:
+                    flush_now = True
+                else:
+                    flush_now = False
+                    if self._timer is None and self.batch_window > 0:
+                        self._timer = threading.Timer(self.batch_window, self._flush)
+                        self._timer.daemon = True
+                        self._timer.start()
+        if not defer:
+            self._run([(key, query, variables)])
+        elif flush_now:
+            self._flush()
+        return future
+
+    def _flush(self):
+        with self._lock:
+            pending, self._pending = self._pending, []
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        for start in range(0, len(pending), self.max_batch):
+            self._run(pending[start:start + self.max_batch])
+
+    def _run(self, batch):
+        try:
+            if len(batch) == 1:
+                results = [self._post(batch[0][1], batch[0][2])]
+            else:
+                try:
+                    document, variables, keys = merge_queries([(query, variables) for _, query, variables in batch])
+                except ValueError:
+                    results = [self._post(query, variables) for _, query, variables in batch]
+                else:
+                    # A merged document's hash depends on the batch's members and almost never repeats
+                    results = _split_response(self._post(document, variables, persist=False), keys)
+        except Exception as exc:
+            results = [exc] * len(batch)
+        for (key, _, _), result in zip(batch, results):
+            with self._lock:
+                future = self._inflight.pop(key)
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def _send(self, payload):
+        body = json.dumps(payload)
+        with self._lock:
+            self.requests_sent += 1
+            self.bytes_sent += len(body)
+        response = self.session.post(self.url, data=body, headers={"Content-Type": "application/json"})
+        response.raise_for_status()
+        return response.json()
+
+    def _post(self, query, variables, persist=True):
+        if not (self.persisted and persist):
+            return self._send({"query": query, "variables": variables or {}})
+        extensions = {"persistedQuery": {"version": 1, "sha256Hash": hashlib.sha256(query.encode()).hexdigest()}}
+        try:
+            result = self._send({"variables": variables or {}, "extensions": extensions})
+        except requests.HTTPError as exc:
+            # Servers may answer a hash-only request with a 4xx; the body says whether it was a cache miss
+            if exc.response is None or exc.response.status_code >= 500:
+                raise
+            result = _error_body(exc.response)
+        if result.get('errors') and not result.get('data'):
+            if not any(e.get('message') == PERSISTED_QUERY_NOT_FOUND for e in result['errors']):
+                # Server does not speak persisted queries at all (e.g. "Must provide query string"); stop trying
+                self.persisted = False
+                return self._send({"query": query, "variables": variables or {}})
+            result = self._send({"query": query, "variables": variables or {}, "extensions": extensions})
+        return result
+
+
+def _error_body(response):
+    try:
+        body = response.json()
+    except ValueError:
+        body = None
+    if not isinstance(body, dict):
+        body = {"errors": [{"message": response.text}]}
+    return body
+
+
+# === LOCAL STAND-IN SERVER ===
+def _argument_values(arguments, variables):
+    values = {}
+    for name, raw in _ARGUMENT.findall(arguments):
+        if raw.startswith('$'):
+            values[name] = variables.get(raw[1:])
+        else:
+            values[name] = json.loads(raw) if raw[0] in '"-0123456789tfn' else raw
+    return values
+
+
+def _project(value, fields, variables):
+    if isinstance(value, list):
+        return [_project(item, fields, variables) for item in value]
+    if value is None:
+        return None
+    result = {}
+    for alias, name, arguments, sub in split_fields(fields):
+        field = value.get(name)
+        if callable(field):
+            field = field(**_argument_values(arguments, variables))
+        result[alias or name] = _project(field, sub, variables) if sub else field
+    return result
+
+
+class LocalGraphQLServer:
+    """
+    In-process stand-in for the ftcscout GraphQL endpoint, for tests and offline runs.
+
+    `roots` maps root field names to callables taking the field's arguments, e.g.
+    {"eventByCode": lambda season, code: {...}}. Nested values may also be callables.
+    Supports automatic persisted queries and counts what it receives. `error_status`
+    is the HTTP status sent with error-only responses (some servers use 400 instead of
+    200), and persisted_queries=False behaves like a server without APQ support.
+    """
+
+    def __init__(self, roots, host="127.0.0.1", port=0, error_status=200, persisted_queries=True):
+        self.roots = roots
+        self.error_status = error_status
+        self.persisted_queries = persisted_queries
+        self.persisted = {}
+        self.requests = 0
+        self.bytes_received = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                raw = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                result = server.handle(raw)
+                body = json.dumps(result).encode()
+                self.send_response(server.error_status if 'data' not in result else 200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer((host, port), Handler)
+        self.url = f"http://{host}:{self._httpd.server_address[1]}/graphql"
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def handle(self, raw):
+        self.requests += 1
+        self.bytes_received += len(raw)
+        payload = json.loads(raw)
+        query = payload.get('query')
+        persisted = (payload.get('extensions') or {}).get('persistedQuery') if self.persisted_queries else None
+        if query is None and persisted is None:
+            return {"errors": [{"message": "Must provide query string."}]}
+        if persisted:
+            digest = persisted['sha256Hash']
+            if query is None:
+                query = self.persisted.get(digest)
+                if query is None:
+                    return {"errors": [{"message": PERSISTED_QUERY_NOT_FOUND}]}
+            elif hashlib.sha256(query.encode()).hexdigest() != digest:
+                return {"errors": [{"message": "provided sha does not match query"}]}
+            else:
+                self.persisted[digest] = query
+        variables = payload.get('variables') or {}
+        _, body = parse_operation(query)
+        return {"data": _project(self.roots, body, variables)}
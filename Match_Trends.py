@@ -0,0 +1,149 @@
+import argparse
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from Ftc_Schemas import match_team_rows
+
+# Alliance score components tracked per match
+COMPONENTS = ['Score', 'Auto', 'DC']
+
+
+# === SERIES ===
+def match_series(rows, event_dates=None):
+    """
+    Every played match of every team in season order, from match_team_rows rows.
+
+    Events are ordered by event_dates (event code -> date) when given, otherwise by
+    code; qualification matches come before playoffs. Rows are grouped by team and
+    'Match No' counts each team's matches from 0.
+    """
+    df = rows[rows['Score'].notna()].copy()
+    dates = df['Event'].map(event_dates) if event_dates else None
+    df['Date'] = pd.to_datetime(dates, utc=True) if dates is not None else pd.NaT
+    df['Playoff'] = df['Level'].ne('Quals')
+    df.sort_values(by=['Team', 'Date', 'Event', 'Playoff', 'Match'], inplace=True, ignore_index=True)
+    df.insert(1, 'Match No', df.groupby('Team').cumcount())
+    return df
+
+
+def _window_sums(values, lo):
+    # Sum of values[lo[i]..i] for every i, from one cumulative sum
+    cumulative = np.concatenate(([0.0], np.cumsum(values)))
+    return cumulative[1:] - cumulative[lo]
+
+
+def rolling_trends(series, window=5, halflife=3.0, components=COMPONENTS):
+    """
+    Takes the output of match_series and adds, for each component, the rolling mean
+    over the last `window` matches ('<c> Avg'), an exponentially weighted mean
+    ('<c> EWM') and the least-squares slope over the same window in points per match
+    ('<c> Trend').
+
+    All teams are handled at once: windows never cross a team boundary because the
+    window start is clamped to the first row of the team.
+    """
+    df = series.copy()
+    n = len(df)
+    position = df['Match No'].to_numpy(np.float64)
+    index = np.arange(n)
+    lo = np.maximum(index - position.astype(np.int64), index - window + 1)
+    count = (index - lo + 1).astype(np.float64)
+
+    sum_x = _window_sums(position, lo)
+    sum_xx = _window_sums(position * position, lo)
+    spread = count * sum_xx - sum_x * sum_x
+    with np.errstate(invalid='ignore', divide='ignore'):
+        for column in components:
+            y = df[column].to_numpy(np.float64)
+            sum_y = _window_sums(y, lo)
+            df[f'{column} Avg'] = sum_y / count
+            sum_xy = _window_sums(position * y, lo)
+            df[f'{column} Trend'] = np.where(spread > 0, (count * sum_xy - sum_x * sum_y) / spread, np.nan)
+    ewm = df.groupby('Team', sort=False)[components].ewm(halflife=halflife).mean().droplevel(0).sort_index()
+    for column in components:
+        df[f'{column} EWM'] = ewm[column].to_numpy()
+    return df
+
+
+def improvement_rates(series, components=COMPONENTS):
+    """Season-long least-squares slope of each component per team, in points per match."""
+    x = series['Match No'].astype(np.float64)
+    parts = {'n': np.ones(len(series)), 'x': x, 'xx': x * x}
+    for column in components:
+        parts[column] = series[column]
+        parts[f'x{column}'] = x * series[column]
+    sums = pd.DataFrame(parts).groupby(series['Team']).sum()
+    spread = sums['n'] * sums['xx'] - sums['x'] ** 2
+    rates = pd.DataFrame({'Matches': sums['n'].astype(int)})
+    for column in components:
+        slope = (sums['n'] * sums[f'x{column}'] - sums['x'] * sums[column]) / spread
+        rates[f'{column} Rate'] = slope.where(spread > 0)
+    return rates
+
+
+def dashboard(trends, components=COMPONENTS):
+    """One row per team: latest rolling/EWM values and season improvement rates, best EWM score first."""
+    latest = trends.groupby('Team', sort=False).tail(1).set_index('Team')
+    columns = [f'{c} {kind}' for c in components for kind in ('Avg', 'EWM', 'Trend')]
+    df = latest[columns].join(improvement_rates(trends, components))
+    return df.sort_values(by=f'{components[0]} EWM', ascending=False)
+
+
+def plot_team_trends(trends, team, ax=None):
+    ax = ax or plt.gca()
+    team_df = trends[trends['Team'] == int(team)]
+    colors = plt.rcParams['axes.prop_cycle'].by_key()['color']
+    for i, column in enumerate(COMPONENTS):
+        color = colors[i % len(colors)]
+        ax.plot(team_df['Match No'], team_df[column], 'o', color=color, alpha=0.35, label=column)
+        ax.plot(team_df['Match No'], team_df[f'{column} Avg'], '--', color=color, label=f'{column} Avg')
+        ax.plot(team_df['Match No'], team_df[f'{column} EWM'], '-', color=color, label=f'{column} EWM')
+    ax.legend(fontsize='small')
+    ax.set_title(f"Team {team}")
+    ax.set_xlabel("Match")
+    ax.set_ylabel("Alliance points")
+    return ax
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-match rolling and EWM score trends for every team")
+    parser.add_argument("--year", type=int, help="Season year (e.g. 2024)")
+    parser.add_argument("--region", help="Only events in this region code")
+    parser.add_argument("--snapshot", help="Read the season from a Season_Snapshot file instead of ftcscout")
+    parser.add_argument("--team", type=int, action='append', help="Only show this team (repeatable)")
+    parser.add_argument("--window", type=int, default=5, help="Rolling window in matches (default 5)")
+    parser.add_argument("--halflife", type=float, default=3.0, help="EWM half-life in matches (default 3)")
+    parser.add_argument("--out", help="Save the per-match trends as CSV")
+    parser.add_argument("--plot", type=int, metavar="TEAM", help="Plot one team's trends")
+    args = parser.parse_args()
+
+    if args.snapshot:
+        from Season_Snapshot import SeasonSnapshot
+        with SeasonSnapshot(args.snapshot) as snapshot:
+            rows, dates = snapshot.match_rows(), snapshot.event_dates()
+    else:
+        if args.year is None:
+            parser.error("--year is required without --snapshot")
+        from Ftc_stats import get_season_events, get_season_matches
+        events = [e for e in get_season_events(args.year) if not args.region or e.get('regionCode') == args.region]
+        rows = match_team_rows(get_season_matches(args.year, [e['code'] for e in events]))
+        dates = {e['code']: e.get('start') for e in events}
+
+    if args.team:
+        rows = rows[rows['Team'].isin(args.team)]
+    trends = rolling_trends(match_series(rows, dates), args.window, args.halflife)
+    board = dashboard(trends)
+    pd.set_option('display.max_columns', None)
+    print(board.round(2).head(50))
+    if args.out:
+        trends.to_csv(args.out, index=False)
+        print(f"\n✅ {len(trends)} match rows for {len(board)} teams saved to {args.out}")
+    if args.plot:
+        plot_team_trends(trends, args.plot)
+        plt.show()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+import argparse
+import bisect
+import time
+
+import pandas as pd
+
+from Advancement_Points_Calculator import qualification_points_batch
+
+# Ranking points per qualification result
+WIN_RP, TIE_RP, LOSS_RP = 2, 1, 0
+# Per-team running totals: ranking points, counted matches, alliance auto, alliance teleop, W, L, T
+RP, PLAYED, AUTO, DC, WINS, LOSSES, TIES = range(7)
+
+
+def match_key(match):
+    return (match.get('tournamentLevel'), match.get('series', 0), match.get('id', match.get('matchNum')))
+
+
+def match_contributions(match):
+    """
+    What one qualification match adds to each team's totals, as {team: totals}.
+
+    Surrogate appearances count for the other teams on the field but not for the
+    surrogate itself. Disqualified and no-show teams play the match for 0 RP and
+    no win, but their alliance's points still count toward tiebreakers.
+    """
+    if match.get('tournamentLevel') != 'Quals' or not match.get('hasBeenPlayed', True):
+        return {}
+    scores = match.get('scores') or {}
+    if not scores.get('red') or not scores.get('blue'):
+        return {}
+    contributions = {}
+    for team in match.get('teams') or []:
+        if team.get('surrogate'):
+            contributions[team['teamNumber']] = None
+            continue
+        alliance = team['alliance']
+        mine = scores[alliance.lower()]
+        theirs = scores['blue' if alliance == 'Red' else 'red']
+        result = (mine['totalPoints'] > theirs['totalPoints']) - (mine['totalPoints'] < theirs['totalPoints'])
+        if team.get('dq') or team.get('noShow'):
+            result = -1
+        totals = [0] * 7
+        totals[RP] = WIN_RP if result > 0 else TIE_RP if result == 0 else LOSS_RP
+        totals[PLAYED] = 1
+        totals[AUTO] = mine.get('autoPoints') or 0
+        totals[DC] = mine.get('dcPoints') or 0
+        totals[WINS if result > 0 else TIES if result == 0 else LOSSES] = 1
+        contributions[team['teamNumber']] = totals
+    return contributions
+
+
+class QualificationRanking:
+    """
+    Live qualification standings for one event.
+
+    Standings are ordered by ranking score (average RP), then average alliance auto
+    points, then average alliance teleop points, then team number. The ordering is a
+    sorted key list: each match only moves the teams that played in it, and a team's
+    rank is a binary search. Finding a team's slot is O(log n), but removing and
+    re-inserting it shifts the list, so each move is O(n). That is a few dozen
+    pointers at event sizes and still far cheaper than re-sorting after every match.
+    A match that arrives again with corrected scores replaces its earlier result.
+    """
+
+    def __init__(self, teams=()):
+        self.totals = {}
+        self.results = {}
+        self._keys = []
+        for team in teams:
+            self._register(team)
+
+    def __len__(self):
+        return len(self.totals)
+
+    def _register(self, team):
+        if team not in self.totals:
+            self.totals[team] = [0] * 7
+            bisect.insort(self._keys, self._key(team))
+
+    def _key(self, team):
+        totals = self.totals[team]
+        played = totals[PLAYED] or 1
+        return (-totals[RP] / played, -totals[AUTO] / played, -totals[DC] / played, team)
+
+    def _apply(self, team, delta, sign):
+        del self._keys[bisect.bisect_left(self._keys, self._key(team))]
+        totals = self.totals[team]
+        for i, value in enumerate(delta):
+            totals[i] += sign * value
+        bisect.insort(self._keys, self._key(team))
+
+    # === UPDATES ===
+    def add_match(self, match):
+        """Apply one match payload; returns the teams whose totals changed."""
+        key = match_key(match)
+        contributions = match_contributions(match)
+        previous = self.results.get(key, {})
+        if contributions == previous:
+            return []
+        for team, delta in previous.items():
+            if delta is not None:
+                self._apply(team, delta, -1)
+        for team, delta in contributions.items():
+            self._register(team)
+            if delta is not None:
+                self._apply(team, delta, 1)
+        self.results[key] = contributions
+        return sorted(set(previous) | set(contributions))
+
+    def add_matches(self, matches):
+        changed = set()
+        for match in matches:
+            changed.update(self.add_match(match))
+        return sorted(changed)
+
+    @classmethod
+    def from_matches(cls, matches, teams=()):
+        ranking = cls(teams)
+        ranking.add_matches(matches)
+        return ranking
+
+    # === LOOKUP ===
+    def rank(self, team):
+        """1-based rank of a team, or None if it is not at this event."""
+        if team not in self.totals:
+            return None
+        return bisect.bisect_left(self._keys, self._key(team)) + 1
+
+    def standings(self):
+        rows = []
+        for rank, key in enumerate(self._keys, start=1):
+            totals = self.totals[key[-1]]
+            rows.append({'Rank': rank, 'Team': key[-1], 'RS': round(-key[0], 3),
+                         'TB1': round(-key[1], 2), 'TB2': round(-key[2], 2),
+                         'W-L-T': f"{totals[WINS]}-{totals[LOSSES]}-{totals[TIES]}", 'Played': totals[PLAYED]})
+        return pd.DataFrame(rows, columns=['Rank', 'Team', 'RS', 'TB1', 'TB2', 'W-L-T', 'Played'])
+
+    def qualification_points(self, alpha=1.07):
+        """Current advancement qualification points for every team, by team number."""
+        if len(self._keys) < 2:
+            return {}
+        points = qualification_points_batch(range(1, len(self._keys) + 1), len(self._keys), alpha)
+        return {key[-1]: p for key, p in zip(self._keys, points)}
+
+
+def main():
+    from Ftc_stats import get_event_matches, get_event_teams
+
+    parser = argparse.ArgumentParser(description="Qualification standings and points computed from match results")
+    parser.add_argument("--year", type=int, required=True, help="Season year (e.g. 2024)")
+    parser.add_argument("--event", required=True, help="Event code")
+    parser.add_argument("--alpha", type=float, default=1.07, help="Alpha constant (default 1.07)")
+    parser.add_argument("--watch", type=float, metavar="SECONDS",
+                        help="Keep polling for new match results every SECONDS")
+    args = parser.parse_args()
+
+    teams = [t['teamNumber'] for t in get_event_teams(args.event, args.year)]
+    ranking = QualificationRanking(teams)
+    while True:
+        changed = ranking.add_matches(get_event_matches(args.event, args.year))
+        if changed:
+            df = ranking.standings()
+            points = ranking.qualification_points(args.alpha)
+            df['Qual Points'] = df['Team'].map(points)
+            print(f"\nStandings at {args.event} ({len(ranking.results)} matches)")
+            print(df.to_string(index=False))
+        if not args.watch:
+            break
+        time.sleep(args.watch)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+import argparse
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+matplotlib.use("Agg")
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+import pandas as pd
+import requests
+
+from Ftc_stats import get_teams_events, normalize_teams_events, plot_teams_comparison
+
+FORMATS = ("png", "svg", "pdf")
+MANIFEST = ".manifest.json"
+# Bump when the chart layout changes so every chart is redrawn once
+STYLE_VERSION = 1
+
+# One figure per worker process, cleared and reused between charts
+_figure = None
+
+
+def get_region_teams(region, limit=10000):
+    # Raise on errors: an empty list here would read as "give --teams and/or --region"
+    url = "https://api.ftcscout.org/rest/v1/teams/search"
+    response = requests.get(url, params={"region": region, "limit": limit})
+    response.raise_for_status()
+    return [str(team['number']) for team in response.json()]
+
+
+def data_hash(team_df, formats):
+    payload = team_df.to_json(orient='split', date_format='iso', index=False)
+    key = f"{STYLE_VERSION}|{','.join(sorted(formats))}|{payload}"
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def _get_figure():
+    global _figure
+    if _figure is None:
+        _figure = Figure(figsize=(10, 6))
+        FigureCanvasAgg(_figure)
+    _figure.clear()
+    return _figure
+
+
+def chart_path(out_dir, team, year, fmt):
+    return os.path.join(out_dir, f"Team_{team}_{year}_Trend.{fmt}")
+
+
+def render_team_chart(team, records, year, out_dir, formats):
+    team_df = pd.DataFrame.from_records(records)
+    team_df['Updated'] = pd.to_datetime(team_df['Updated'], utc=True)
+    fig = _get_figure()
+    ax = fig.add_subplot()
+    plot_teams_comparison(team_df, ax)
+    ax.set_title(f"Team {team} - {year} season")
+    fig.autofmt_xdate()
+    paths = []
+    for fmt in formats:
+        path = chart_path(out_dir, team, year, fmt)
+        fig.savefig(path, format=fmt, bbox_inches='tight')
+        paths.append(path)
+    return team, paths
+
+
+def render_charts(team_ids, year, out_dir="charts", formats=("png",), workers=None, force=False):
+    os.makedirs(out_dir, exist_ok=True)
+    manifest_path = os.path.join(out_dir, MANIFEST)
+    manifest = {}
+    if os.path.exists(manifest_path) and not force:
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+
+    df = normalize_teams_events(get_teams_events(team_ids, year))
+    jobs = {}
+    for team, team_df in df.groupby('Team', sort=False):
+        digest = data_hash(team_df, formats)
+        on_disk = all(os.path.exists(chart_path(out_dir, team, year, fmt)) for fmt in formats)
+        if manifest.get(team) == digest and on_disk:
+            continue
+        jobs[team] = (digest, team_df.to_dict('records'))
+
+    rendered = {}
+    if jobs:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(render_team_chart, team, records, year, out_dir, formats)
+                       for team, (_, records) in jobs.items()]
+            for future in futures:
+                team, paths = future.result()
+                manifest[team] = jobs[team][0]
+                rendered[team] = paths
+
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    skipped = df['Team'].nunique() - len(jobs)
+    return rendered, skipped
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render per-team season trend charts without a display")
+    parser.add_argument("--year", required=True, help="Season year (e.g. 2024)")
+    parser.add_argument("--teams", nargs='+', default=[], help="Team numbers to render")
+    parser.add_argument("--region", help="Render every team in this ftcscout region (e.g. RO)")
+    parser.add_argument("--out", default="charts", help="Output directory (default charts)")
+    parser.add_argument("--format", action='append', choices=FORMATS, dest='formats',
+                        help="Output format, can be repeated (default png)")
+    parser.add_argument("--workers", type=int, default=None, help="Render processes (default CPU count)")
+    parser.add_argument("--force", action='store_true', help="Redraw charts even if their data is unchanged")
+    args = parser.parse_args()
+
+    team_ids = list(args.teams)
+    if args.region:
+        team_ids += get_region_teams(args.region)
+    if not team_ids:
+        parser.error("give --teams and/or --region")
+    team_ids = list(dict.fromkeys(team_ids))
+
+    rendered, skipped = render_charts(team_ids, args.year, args.out, args.formats or ["png"], args.workers, args.force)
+    for team, paths in rendered.items():
+        print(f"Team {team}: {', '.join(paths)}")
+    print(f"\n✅ Rendered {len(rendered)} team charts, {skipped} unchanged")
+
+
+if __name__ == "__main__":
+    main()
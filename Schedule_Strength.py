@@ -0,0 +1,113 @@
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from Ftc_Schemas import QUICK_STATS, match_team_rows, project
+from Ftc_stats import fetch_concurrently, get_season_matches, get_team_quick_stats
+
+# Ranking points per qualification match result
+RP_WIN = 2
+RP_TIE = 1
+
+
+def normal_cdf(x):
+    """Vectorized standard normal CDF (Abramowitz & Stegun 7.1.26 erf, |error| < 1.5e-7)."""
+    z = np.abs(x) / np.sqrt(2)
+    t = 1 / (1 + 0.3275911 * z)
+    poly = t * (0.254829592 + t * (-0.284496736 + t * (1.421413741 + t * (-1.453152027 + t * 1.061405429))))
+    erf = 1 - poly * np.exp(-z * z)
+    return 0.5 * (1 + np.sign(x) * erf)
+
+
+def season_oprs(team_numbers, year):
+    stats = fetch_concurrently(team_numbers, lambda team, session: get_team_quick_stats(team, year, session))
+    teams = [team for team, s in stats.items() if s]
+    oprs = project([s for s in stats.values() if s], QUICK_STATS, ['Total OPR'])['Total OPR']
+    return pd.Series(oprs.to_numpy(), index=teams, name='OPR')
+
+
+def schedule_strength(rows, oprs):
+    """
+    Per (event, team) schedule metrics from match rows (Ftc_Schemas.match_team_rows) and a
+    team -> OPR Series. Only qualification matches count; surrogate appearances are
+    scheduled like any other match but earn no ranking points.
+
+    Expected RP comes from a normal model of the match margin: the predicted margin is the
+    alliance OPR sum minus the opposing sum, and its spread is the season-wide standard
+    deviation of (actual - predicted) margins.
+    """
+    if rows['Level'].notna().any():
+        rows = rows[rows['Level'] == 'Quals']
+    rows = rows.reset_index(drop=True)
+    opr = rows['Team'].map(oprs).fillna(oprs.mean()).to_numpy()
+
+    keys = [rows['Event'], rows['Match']]
+    alliance_keys = keys + [rows['Alliance']]
+    alliance_opr = pd.Series(opr).groupby(alliance_keys).transform('sum').to_numpy()
+    match_opr = pd.Series(opr).groupby(keys).transform('sum').to_numpy()
+    alliance_size = rows.groupby(alliance_keys)['Team'].transform('size').to_numpy()
+    match_size = rows.groupby(keys)['Team'].transform('size').to_numpy()
+    opponent_opr = match_opr - alliance_opr
+    partner_opr = alliance_opr - opr
+
+    score, opp_score = rows['Score'].to_numpy(), rows['Opp Score'].to_numpy()
+    played = ~(np.isnan(score) | np.isnan(opp_score))
+    predicted = alliance_opr - opponent_opr
+    residual = (score - opp_score - predicted)[played]
+    sigma = residual.std() if residual.size > 1 and residual.std() > 0 else max(np.abs(predicted).mean(), 1.0)
+    counted = played & ~rows['Surrogate'].to_numpy(bool)
+
+    metrics = pd.DataFrame({
+        'Event': rows['Event'],
+        'Team': rows['Team'],
+        'Matches': counted.astype(int),
+        'Partner OPR': np.where(alliance_size > 1, partner_opr / np.maximum(alliance_size - 1, 1), np.nan),
+        'Opponent OPR': opponent_opr / np.maximum(match_size - alliance_size, 1),
+        'Difficulty': opponent_opr - partner_opr,
+        'Expected RP': np.where(counted, RP_WIN * normal_cdf(predicted / sigma), 0.0),
+        'Actual RP': np.where(counted, RP_WIN * (score > opp_score) + RP_TIE * (score == opp_score), 0),
+    })
+    per_team = metrics.groupby(['Event', 'Team'], sort=True).agg({
+        'Matches': 'sum', 'Partner OPR': 'mean', 'Opponent OPR': 'mean', 'Difficulty': 'mean',
+        'Expected RP': 'sum', 'Actual RP': 'sum',
+    }).reset_index()
+    per_team['Luck'] = per_team['Actual RP'] - per_team['Expected RP']
+    # Higher percentile = harder schedule than the rest of the event
+    per_team['Difficulty Pct'] = per_team.groupby('Event')['Difficulty'].rank(pct=True) * 100
+    return per_team.round({'Partner OPR': 1, 'Opponent OPR': 1, 'Difficulty': 1, 'Expected RP': 2,
+                           'Luck': 2, 'Difficulty Pct': 0})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Strength of schedule and luck for every team in a season")
+    parser.add_argument("--year", required=True, help="Season year (e.g. 2024)")
+    parser.add_argument("--event", action='append', help="Only these event codes (can be repeated)")
+    parser.add_argument("--team", type=int, help="Only show this team")
+    parser.add_argument("--snapshot", help="Read matches and OPRs from a Season_Snapshot file")
+    parser.add_argument("--out", help="Also save the table as CSV")
+    args = parser.parse_args()
+
+    if args.snapshot:
+        from Season_Snapshot import SeasonSnapshot
+        with SeasonSnapshot(args.snapshot) as snapshot:
+            rows, oprs = snapshot.match_rows(), snapshot.oprs()
+        if args.event:
+            rows = rows[rows['Event'].isin(args.event)]
+    else:
+        rows = match_team_rows(get_season_matches(args.year, args.event))
+        oprs = season_oprs(sorted(rows['Team'].unique().tolist()), args.year)
+
+    df = schedule_strength(rows, oprs)
+    if args.team is not None:
+        df = df[df['Team'] == args.team]
+    pd.set_option('display.max_rows', None)
+    pd.set_option('display.max_columns', None)
+    print(df.sort_values(by=['Event', 'Difficulty Pct'], ascending=[True, False]).to_string(index=False))
+    if args.out:
+        df.to_csv(args.out, index=False)
+        print(f"\n✅ Saved as: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
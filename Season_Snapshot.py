@@ -0,0 +1,321 @@
+import argparse
+import json
+import mmap
+import struct
+
+import numpy as np
+import pandas as pd
+
+from Ftc_Schemas import TEAM_EVENT_PARTICIPATION, match_team_rows, project
+from Ftc_stats import (fetch_concurrently, get_event_teams, get_season_events, get_season_matches,
+                       get_team_quick_stats, search_teams)
+
+MAGIC = b"FTCSNAP1"
+HEADER = struct.Struct("<8sQ")
+ALIGN = 64
+
+# table -> column -> dtype; "str" columns hold int32 ids into the sorted string table
+SCHEMA = {
+    'teams': {'number': '<i4', 'name': 'str', 'city': 'str', 'state': 'str', 'country': 'str', 'rookie_year': '<i4'},
+    'events': {'code': 'str', 'name': 'str', 'start': 'str', 'region': 'str', 'type': 'str'},
+    'team_events': {'team': '<i4', 'event': 'str', 'updated': 'str',
+                    'total': '<f8', 'auto': '<f8', 'dc': '<f8', 'rank': '<f8'},
+    'matches': {'event': 'str', 'match': '<i4', 'level': 'str', 'team': '<i4', 'alliance': '<i1',
+                'surrogate': '<i1', 'score': '<f8', 'auto': '<f8', 'dc': '<f8', 'opp_score': '<f8'},
+    'quick_stats': {'team': '<i4', 'tot': '<f8', 'auto': '<f8', 'dc': '<f8'},
+}
+# Each table is written sorted by these columns so lookups are binary searches
+SORT_KEYS = {
+    'teams': ['number'],
+    'events': ['code'],
+    'team_events': ['team', 'updated'],
+    'matches': ['event', 'match', 'alliance', 'team'],
+    'quick_stats': ['team'],
+}
+ALLIANCES = ('Red', 'Blue')
+
+
+def _data_start(directory_size):
+    start = HEADER.size + directory_size
+    return start + -start % ALIGN
+
+
+def _pad(f):
+    f.write(b"\0" * (-f.tell() % ALIGN))
+
+
+def write_snapshot(path, tables, meta=None):
+    """Write DataFrames matching SCHEMA into a single snapshot file of fixed-width columns."""
+    strings = set()
+    for name, columns in SCHEMA.items():
+        for column, dtype in columns.items():
+            if dtype == 'str':
+                strings.update(tables[name][column].fillna('').astype(str))
+    strings = sorted(strings, key=lambda s: s.encode())
+    string_ids = {s: i for i, s in enumerate(strings)}
+    blobs = [s.encode() for s in strings]
+    string_offsets = np.concatenate([[0], np.cumsum([len(b) for b in blobs], dtype=np.int64)]).astype('<i8')
+
+    arrays = {}
+    for name, columns in SCHEMA.items():
+        df = tables[name]
+        encoded = {}
+        for column, dtype in columns.items():
+            if dtype == 'str':
+                encoded[column] = df[column].fillna('').astype(str).map(string_ids).to_numpy('<i4')
+            else:
+                encoded[column] = df[column].to_numpy(dtype)
+        order = np.lexsort([encoded[key] for key in reversed(SORT_KEYS[name])])
+        arrays[name] = {column: np.ascontiguousarray(values[order]) for column, values in encoded.items()}
+
+    # Offsets are relative to the first aligned byte after the directory
+    directory = {'meta': meta or {}, 'tables': {}, 'strings': {}}
+    position = 0
+
+    def place(array):
+        nonlocal position
+        position += -position % ALIGN
+        offset = position
+        position += array.nbytes
+        return offset
+
+    for name, columns in arrays.items():
+        table = directory['tables'][name] = {'rows': len(next(iter(columns.values()))), 'columns': {}}
+        for column, values in columns.items():
+            table['columns'][column] = {'dtype': values.dtype.str, 'kind': SCHEMA[name][column], 'offset': place(values)}
+    blob = b"".join(blobs)
+    directory['strings'] = {'count': len(strings), 'offsets': place(string_offsets),
+                            'blob': place(np.frombuffer(blob, dtype=np.uint8)), 'size': len(blob)}
+
+    raw = json.dumps(directory).encode()
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(raw)))
+        f.write(raw)
+        for columns in arrays.values():
+            for values in columns.values():
+                _pad(f)
+                f.write(values.tobytes())
+        _pad(f)
+        f.write(string_offsets.tobytes())
+        _pad(f)
+        f.write(blob)
+
+
+class SeasonSnapshot:
+    """
+    Read-only view of a snapshot file. Columns are NumPy arrays backed directly by the
+    memory map, so nothing is read from disk until a lookup touches its pages.
+    """
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, size = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a season snapshot")
+        self.directory = json.loads(bytes(self._mmap[HEADER.size:HEADER.size + size]))
+        self.meta = self.directory['meta']
+        start = _data_start(size)
+        strings = self.directory['strings']
+        self._string_offsets = np.frombuffer(self._mmap, '<i8', strings['count'] + 1, start + strings['offsets'])
+        self._blob = start + strings['blob']
+        self._columns = {}
+        for name, table in self.directory['tables'].items():
+            for column, info in table['columns'].items():
+                self._columns[name, column] = np.frombuffer(
+                    self._mmap, info['dtype'], table['rows'], start + info['offset'])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._columns.clear()
+        self._string_offsets = None
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass  # a caller still holds a column view; the map is released with it
+        self._file.close()
+
+    def column(self, table, column):
+        return self._columns[table, column]
+
+    def string(self, string_id):
+        start, stop = self._string_offsets[string_id], self._string_offsets[string_id + 1]
+        return self._mmap[self._blob + start:self._blob + stop].decode()
+
+    def strings(self, ids):
+        # Decode each distinct id once; columns like event codes repeat heavily
+        unique, inverse = np.unique(ids, return_inverse=True)
+        return np.array([self.string(i) for i in unique], dtype=object)[inverse.reshape(-1)]
+
+    def string_id(self, value):
+        # The string table is sorted by UTF-8 bytes, so this is a binary search over the map
+        key = value.encode()
+        lo, hi = 0, len(self._string_offsets) - 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start, stop = self._string_offsets[mid], self._string_offsets[mid + 1]
+            if self._mmap[self._blob + start:self._blob + stop] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(self._string_offsets) - 1 and self.string(lo) == value:
+            return lo
+        return -1
+
+    def _rows(self, table, column, value):
+        values = self.column(table, column)
+        return slice(np.searchsorted(values, value, 'left'), np.searchsorted(values, value, 'right'))
+
+    def _frame(self, table, rows):
+        data = {}
+        for column, kind in SCHEMA[table].items():
+            values = self.column(table, column)[rows]
+            data[column] = self.strings(values) if kind == 'str' else values
+        return pd.DataFrame(data)
+
+    def team(self, team_number):
+        df = self._frame('teams', self._rows('teams', 'number', team_number))
+        return df.iloc[0].to_dict() if len(df) else None
+
+    def team_events(self, team_ids):
+        """Same long-format frame as Ftc_stats.normalize_teams_events."""
+        frames = []
+        for team in team_ids:
+            df = self._frame('team_events', self._rows('team_events', 'team', int(team)))
+            frames.append(df.assign(team=str(team)))
+        df = pd.concat(frames, ignore_index=True) if frames else self._frame('team_events', slice(0, 0))
+        df = df.rename(columns={'team': 'Team', 'total': 'Total', 'auto': 'Auto Avg', 'dc': 'DC Avg',
+                                'rank': 'Rank', 'event': 'Event', 'updated': 'Updated'})
+        df = df[['Team', 'Total', 'Auto Avg', 'DC Avg', 'Rank', 'Event', 'Updated']]
+        df['Updated'] = pd.to_datetime(df['Updated'].replace('', None), utc=True)
+        df.sort_values(by=['Updated', 'Team'], ascending=True, inplace=True, ignore_index=True)
+        df.insert(1, 'Event No', df.groupby('Team').cumcount())
+        return df
+
+    def opr(self, team_number):
+        """Same shape as GetOpr.get_team_opr."""
+        rows = self._rows('quick_stats', 'team', int(team_number))
+        if rows.start == rows.stop:
+            return {'Auto': 0, 'TeleOp': 0, 'Total': 0}
+        i = rows.start
+        return {
+            'Auto': round(float(self.column('quick_stats', 'auto')[i]), 1),
+            'TeleOp': round(float(self.column('quick_stats', 'dc')[i]), 1),
+            'Total': round(float(self.column('quick_stats', 'tot')[i]), 1),
+        }
+
+    def event_ranking(self, event_code):
+        event_id = self.string_id(event_code)
+        rows = np.flatnonzero(self.column('team_events', 'event') == event_id)
+        df = pd.DataFrame({
+            'team': self.column('team_events', 'team')[rows],
+            'rank': self.column('team_events', 'rank')[rows],
+        })
+        return df.sort_values(by=['rank', 'team'], ignore_index=True)
+
+    def team_rank(self, team_number, event_code):
+        """(rank, number of ranked teams) at an event, as needed by qualification_points."""
+        ranking = self.event_ranking(event_code).dropna()
+        rank = ranking.loc[ranking['team'] == int(team_number), 'rank']
+        if rank.empty:
+            return None
+        return int(rank.iloc[0]), len(ranking)
+
+    def match_rows(self):
+        """Every match row of the season, in the same frame as Ftc_Schemas.match_team_rows."""
+        df = self._frame('matches', slice(None))
+        df['alliance'] = np.asarray(ALLIANCES)[df['alliance']]
+        df['surrogate'] = df['surrogate'].astype(bool)
+        return df.rename(columns={
+            'event': 'Event', 'match': 'Match', 'level': 'Level', 'team': 'Team', 'alliance': 'Alliance',
+            'surrogate': 'Surrogate', 'score': 'Score', 'auto': 'Auto', 'dc': 'DC', 'opp_score': 'Opp Score'})
+
+    def event_dates(self):
+        """Event code -> start date, for ordering matches across a season."""
+        df = self._frame('events', slice(None))
+        return dict(zip(df['code'], df['start']))
+
+    def oprs(self):
+        """Season total OPR per team number."""
+        return pd.Series(self.column('quick_stats', 'tot'), index=self.column('quick_stats', 'team'), name='OPR')
+
+    def event_matches(self, event_code):
+        df = self._frame('matches', self._rows('matches', 'event', self.string_id(event_code)))
+        df['alliance'] = [ALLIANCES[a] for a in df['alliance']]
+        df['surrogate'] = df['surrogate'].astype(bool)
+        return df
+
+
+# === BUILD FROM FTCSCOUT ===
+def snapshot_tables(teams, events, participations, matches_by_event, quick_stats):
+    teams_df = pd.DataFrame({
+        'number': [t['number'] for t in teams],
+        'name': [t.get('name') for t in teams],
+        'city': [t.get('city') for t in teams],
+        'state': [t.get('state') for t in teams],
+        'country': [t.get('country') for t in teams],
+        'rookie_year': [t.get('rookieYear') or 0 for t in teams],
+    })
+    events_df = pd.DataFrame({
+        'code': [e['code'] for e in events],
+        'name': [e.get('name') for e in events],
+        'start': [e.get('start') for e in events],
+        'region': [e.get('regionCode') for e in events],
+        'type': [e.get('type') for e in events],
+    })
+    team_events = project(participations, TEAM_EVENT_PARTICIPATION)
+    team_events = pd.DataFrame({
+        'team': team_events['Team'].fillna(0).astype(int), 'event': team_events['Event'],
+        'updated': [p.get('updatedAt') for p in participations], 'total': team_events['Total'],
+        'auto': team_events['Auto Avg'], 'dc': team_events['DC Avg'], 'rank': team_events['Rank'],
+    })
+
+    matches_df = match_team_rows(matches_by_event).rename(columns={
+        'Event': 'event', 'Match': 'match', 'Level': 'level', 'Team': 'team', 'Alliance': 'alliance',
+        'Surrogate': 'surrogate', 'Score': 'score', 'Auto': 'auto', 'DC': 'dc', 'Opp Score': 'opp_score'})
+    matches_df['alliance'] = matches_df['alliance'].map(ALLIANCES.index)
+
+    quick_df = pd.DataFrame({
+        'team': [team for team, stats in quick_stats.items() if stats],
+        'tot': [stats['tot']['value'] for stats in quick_stats.values() if stats],
+        'auto': [stats['auto']['value'] for stats in quick_stats.values() if stats],
+        'dc': [stats['dc']['value'] for stats in quick_stats.values() if stats],
+    })
+    return {'teams': teams_df, 'events': events_df, 'team_events': team_events,
+            'matches': matches_df, 'quick_stats': quick_df}
+
+
+def build_snapshot(year, path):
+    events = get_season_events(year)
+    codes = [event['code'] for event in events]
+    participations = [p for ps in fetch_concurrently(
+        codes, lambda code, session: get_event_teams(code, year, session)).values() for p in ps]
+    matches_by_event = get_season_matches(year, codes)
+    team_numbers = sorted({p['teamNumber'] for p in participations})
+    wanted = set(team_numbers)
+    teams = [t for t in search_teams() if t['number'] in wanted]
+    quick_stats = fetch_concurrently(team_numbers, lambda team, session: get_team_quick_stats(team, year, session))
+    tables = snapshot_tables(teams, events, participations, matches_by_event, quick_stats)
+    write_snapshot(path, tables, meta={'season': int(year)})
+    return tables
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack a season into a memory-mapped snapshot file")
+    parser.add_argument("--year", required=True, help="Season year (e.g. 2024)")
+    parser.add_argument("--out", help="Snapshot file (default season_<year>.ftcsnap)")
+    args = parser.parse_args()
+
+    out = args.out or f"season_{args.year}.ftcsnap"
+    tables = build_snapshot(args.year, out)
+    sizes = ", ".join(f"{len(df)} {name}" for name, df in tables.items())
+    print(f"\n✅ Snapshot saved as: {out} ({sizes})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import re
+import time
+from argparse import Namespace
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import requests
+
+from Advancement_Points_Calculator import compute_points_from_args, parse_award_input
+from Ftc_Schemas import TEAM_EVENT_STATS, project
+from Ftc_stats import get_event_matches, get_team, get_team_events, get_team_quick_stats
+
+NO_OPR = {'Auto': 0, 'TeleOp': 0, 'Total': 0}
+# Fetches where a 404 means "nothing recorded" (cached as None) rather than an error
+MISSING_IS_EMPTY = {'team', 'quick_stats'}
+
+
+# === SHARED CACHE WITH COALESCING ===
+class StrictSession(requests.Session):
+    """
+    Session for the Ftc_stats fetchers that raises on any non-200 response and never
+    waits longer than `timeout`, so an upstream error is not mistaken for empty data.
+    """
+
+    def __init__(self, timeout=10.0):
+        super().__init__()
+        self.timeout = timeout
+
+    def get(self, url, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        response = super().get(url, **kwargs)
+        if response.status_code != 200:
+            response.raise_for_status()
+            raise requests.HTTPError(f"{response.status_code} from {url}", response=response)
+        return response
+
+
+class Upstream:
+    """
+    ftcscout fetches shared by every client: memory cache, then disk cache, then one
+    upstream call per key no matter how many requests are waiting for it. Failed
+    fetches raise to every waiting request and are never cached, except a 404 for a
+    team or its quick stats, which is cached as None like GetOpr treats it.
+    """
+
+    def __init__(self, cache_dir="stats_cache", ttl=60.0, timeout=10.0):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.session = StrictSession(timeout)
+        self.memory = {}
+        self.inflight = {}
+        self.counters = {'upstream': 0, 'memory_hits': 0, 'disk_hits': 0, 'coalesced': 0}
+        self.fetchers = {
+            'team': get_team,
+            'team_events': get_team_events,
+            'quick_stats': get_team_quick_stats,
+            'matches': get_event_matches,
+        }
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _disk_path(self, key):
+        return os.path.join(self.cache_dir, hashlib.sha1(key.encode()).hexdigest() + ".json")
+
+    def _read_disk(self, key):
+        # (found, value): a cached None is a real answer, not a miss
+        path = self._disk_path(key)
+        if not os.path.exists(path) or time.time() - os.path.getmtime(path) > self.ttl:
+            return False, None
+        with open(path) as f:
+            return True, json.load(f)
+
+    def _write_disk(self, key, value):
+        path = self._disk_path(key)
+        with open(path + ".tmp", "w") as f:
+            json.dump(value, f)
+        os.replace(path + ".tmp", path)
+
+    async def get(self, kind, *args):
+        key = json.dumps([kind, *args])
+        cached = self.memory.get(key)
+        if cached and time.monotonic() - cached[0] <= self.ttl:
+            self.counters['memory_hits'] += 1
+            return cached[1]
+        task = self.inflight.get(key)
+        if task is not None:
+            self.counters['coalesced'] += 1
+            return await task
+        task = self.inflight[key] = asyncio.ensure_future(self._load(key, kind, args))
+        try:
+            return await task
+        finally:
+            self.inflight.pop(key, None)
+
+    async def _load(self, key, kind, args):
+        found, value = await asyncio.to_thread(self._read_disk, key)
+        if found:
+            self.counters['disk_hits'] += 1
+        else:
+            self.counters['upstream'] += 1
+            try:
+                value = await asyncio.to_thread(self.fetchers[kind], *args, session=self.session)
+            except requests.HTTPError as exc:
+                if kind not in MISSING_IS_EMPTY or exc.response is None or exc.response.status_code != 404:
+                    raise
+                value = None
+            await asyncio.to_thread(self._write_disk, key, value)
+        self.memory[key] = (time.monotonic(), value)
+        return value
+
+
+# === COMPUTATIONS ===
+def team_schedule(matches, team_id):
+    """Partner/opponent rows for one team, as printed by Get_Teams_At_Event."""
+    rows = []
+    for i, match in enumerate(matches):
+        teams = match['teams']
+        mine = next((t for t in teams if t['teamNumber'] == team_id), None)
+        if mine is None:
+            continue
+        alliance = mine['alliance']
+        partner = [t['teamNumber'] for t in teams if t['alliance'] == alliance and t['teamNumber'] != team_id]
+        opponents = [t['teamNumber'] for t in teams if t['alliance'] != alliance]
+        rows.append({'Match': f"Q{match.get('matchNum', i + 1)}", 'Alliance': alliance, 'Your Team': team_id,
+                     'Partner': partner[0] if partner else None,
+                     'Opponent 1': opponents[0] if opponents else None,
+                     'Opponent 2': opponents[1] if len(opponents) > 1 else None})
+    return rows
+
+
+def opr_of(stats):
+    """quick-stats payload -> the OPR triple used by GetOpr."""
+    if not stats:
+        return dict(NO_OPR)
+    return {'Auto': round(stats.get('auto', {}).get('value', 0), 1),
+            'TeleOp': round(stats.get('dc', {}).get('value', 0), 1),
+            'Total': round(stats.get('tot', {}).get('value', 0), 1)}
+
+
+class StatsService:
+    def __init__(self, upstream):
+        self.upstream = upstream
+
+    async def team_events(self, team, year):
+        data = await self.upstream.get('team_events', team, year)
+        df = project(data or [], TEAM_EVENT_STATS)
+        df['Updated'] = df['Updated'].astype(str)
+        return json.loads(df.to_json(orient='records'))
+
+    async def quick_stats(self, team, season=None):
+        return await self.upstream.get('quick_stats', team, season)
+
+    async def _names(self, numbers):
+        teams = await asyncio.gather(*(self.upstream.get('team', n) for n in numbers))
+        return {n: (t or {}).get('name', 'Unknown') for n, t in zip(numbers, teams)}
+
+    async def schedule(self, year, event_code, team, with_opr=False):
+        matches = await self.upstream.get('matches', event_code, year)
+        rows = team_schedule(matches or [], team)
+        numbers = sorted({r[c] for r in rows for c in ('Your Team', 'Partner', 'Opponent 1', 'Opponent 2')
+                          if r[c] is not None})
+        names = await self._names(numbers)
+        if with_opr:
+            stats = await asyncio.gather(*(self.upstream.get('quick_stats', n, year) for n in numbers))
+            oprs = {n: opr_of(s) for n, s in zip(numbers, stats)}
+        for row in rows:
+            for column in ('Your Team', 'Partner', 'Opponent 1', 'Opponent 2'):
+                number = row[column]
+                row[column] = {'number': number, 'name': names.get(number)} if number is not None else None
+                if with_opr and number is not None:
+                    row[column]['opr'] = oprs[number]
+        return rows
+
+    async def advancement(self, query):
+        awards = [parse_award_input(a.replace(':', ' ')) for a in query.get('award', [])]
+        if None in awards:
+            raise ValueError("award must look like inspire:1 or other:2")
+        args = Namespace(
+            rank=int(query['rank'][0]), teams=int(query['teams'][0]),
+            alpha=float(query.get('alpha', ['1.07'])[0]),
+            captain=int(query.get('captain', ['0'])[0]), draft=int(query.get('draft', ['0'])[0]),
+            playoff=int(query.get('playoff', ['0'])[0]), award=awards,
+        )
+        breakdown, total = compute_points_from_args(args)
+        return {'breakdown': [{'category': c, 'points': p, 'note': n} for c, p, n in breakdown], 'total': total}
+
+
+# === HTTP ===
+ROUTES = [
+    (re.compile(r"^/teams/(\d+)/events/(\d+)$"), 'team_events'),
+    (re.compile(r"^/teams/(\d+)/quick-stats$"), 'quick_stats'),
+    (re.compile(r"^/events/(\d+)/([^/]+)/schedule$"), 'schedule'),
+    (re.compile(r"^/advancement$"), 'advancement'),
+    (re.compile(r"^/stats$"), 'stats'),
+]
+
+
+async def route(service, target):
+    parts = urlsplit(target)
+    query = parse_qs(parts.query)
+    path = unquote(parts.path)
+    for pattern, name in ROUTES:
+        match = pattern.match(path)
+        if not match:
+            continue
+        args = match.groups()
+        if name == 'team_events':
+            return await service.team_events(int(args[0]), int(args[1]))
+        if name == 'quick_stats':
+            season = query.get('season', [None])[0]
+            return await service.quick_stats(int(args[0]), int(season) if season else None)
+        if name == 'schedule':
+            if 'team' not in query:
+                raise ValueError("schedule needs ?team=<number>")
+            return await service.schedule(int(args[0]), args[1], int(query['team'][0]),
+                                          query.get('opr', ['0'])[0] not in ('0', 'false', ''))
+        if name == 'advancement':
+            return await service.advancement(query)
+        return dict(service.upstream.counters)
+    raise LookupError(path)
+
+
+async def handle(service, reader, writer):
+    try:
+        request_line = (await reader.readline()).decode('latin-1').split()
+        while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+            pass
+        if len(request_line) < 2 or request_line[0] != "GET":
+            status, payload = "405 Method Not Allowed", {'error': "only GET is supported"}
+        else:
+            try:
+                status, payload = "200 OK", await route(service, request_line[1])
+            except LookupError as exc:
+                status, payload = "404 Not Found", {'error': f"no endpoint {exc}"}
+            except (KeyError, ValueError) as exc:
+                status, payload = "400 Bad Request", {'error': str(exc)}
+            except requests.HTTPError as exc:
+                if exc.response is not None and exc.response.status_code == 404:
+                    status, payload = "404 Not Found", {'error': f"ftcscout has no {request_line[1]}"}
+                else:
+                    status, payload = "502 Bad Gateway", {'error': f"ftcscout error: {exc}"}
+            except requests.RequestException as exc:
+                status, payload = "502 Bad Gateway", {'error': f"ftcscout unreachable: {exc}"}
+            except Exception as exc:
+                status, payload = "500 Internal Server Error", {'error': f"{type(exc).__name__}: {exc}"}
+        body = json.dumps(payload).encode()
+        writer.write(f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n"
+                     f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body)
+        await writer.drain()
+    finally:
+        writer.close()
+
+
+async def serve(host="0.0.0.0", port=8765, cache_dir="stats_cache", ttl=60.0, timeout=10.0):
+    service = StatsService(Upstream(cache_dir, ttl, timeout))
+    server = await asyncio.start_server(lambda r, w: handle(service, r, w), host, port)
+    print(f"Serving FTC stats on http://{host}:{port} (cache {cache_dir}, ttl {ttl:g}s)")
+    print("  /teams/<team>/events/<year>  /teams/<team>/quick-stats?season=<year>")
+    print("  /events/<year>/<code>/schedule?team=<team>[&opr=1]")
+    print("  /advancement?rank=<R>&teams=<N>[&captain=&draft=&playoff=&award=inspire:1]  /stats")
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Shared FTC stats service for several scouts on one network")
+    parser.add_argument("--host", default="0.0.0.0", help="Interface to listen on (default all)")
+    parser.add_argument("--port", type=int, default=8765, help="Port (default 8765)")
+    parser.add_argument("--cache-dir", default="stats_cache", help="On-disk cache directory")
+    parser.add_argument("--ttl", type=float, default=60.0, help="Seconds before cached data is refetched (default 60)")
+    parser.add_argument("--timeout", type=float, default=10.0, help="Seconds to wait for ftcscout (default 10)")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.cache_dir, args.ttl, args.timeout))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
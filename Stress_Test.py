@@ -0,0 +1,207 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import matplotlib
+matplotlib.use("Agg")
+import numpy as np
+import pandas as pd
+
+from Ftc_Schemas import match_team_rows
+from Ftc_stats import normalize_teams_events
+from Get_Teams_At_Event_GRAPHQL import save_matches_pdf
+from Match_Trends import dashboard, match_series, rolling_trends
+from Ranking_Engine import QualificationRanking
+from Schedule_Strength import schedule_strength
+from Season_Snapshot import SeasonSnapshot, snapshot_tables, write_snapshot
+from Stats_Server import opr_of, team_schedule
+from Synthetic_Season import SCALES, generate
+from Team_Graph import TeamGraph
+
+# Allowed slack on the fitted log-log slope before a stage counts as scaling too fast
+TOLERANCE = 0.3
+# Timings below this are mostly noise and are left out of the fit
+MIN_SECONDS = 0.005
+# A slope fitted over less than this spread of n (max/min) mostly measures timing noise
+MIN_RANGE = 4.0
+# PDF tables cost ~20 ms a row: rows grow with the event count up to a cap, a 10x spread across the ladder
+PDF_ROWS_PER_EVENT = 20
+PDF_MAX_ROWS = 200
+
+
+# === STAGES ===
+# Each stage takes the generated season (plus a scratch directory) and returns its input size n.
+def stage_normalize(data, tmp):
+    by_team = {}
+    for p in data['participations']:
+        by_team.setdefault(p['teamNumber'], []).append(p)
+    normalize_teams_events(by_team)
+    return len(data['participations'])
+
+
+def stage_match_rows(data, tmp):
+    return len(match_team_rows(data['matches']))
+
+
+def stage_match_table_pdf(data, tmp):
+    rows = min(PDF_ROWS_PER_EVENT * len(data['events']), PDF_MAX_ROWS)
+    frames, total = [], 0
+    for code, matches in data['matches'].items():
+        frames.append(match_team_rows({code: matches}))
+        total += len(frames[-1])
+        if total >= rows:
+            break
+    df = pd.concat(frames, ignore_index=True)[['Match', 'Alliance', 'Team', 'Score', 'Opp Score']].head(rows)
+    save_matches_pdf(df, os.path.join(tmp, "matches.pdf"))
+    return len(df)
+
+
+def stage_co_occurrence(data, tmp):
+    graph = TeamGraph.from_matches(data['matches'])
+    path = os.path.join(tmp, "graph.npz")
+    graph.save(path)
+    TeamGraph.load(path).neighbours(int(graph.teams[0]))
+    return sum(len(m['teams']) for ms in data['matches'].values() for m in ms)
+
+
+def stage_opr_schedule(data, tmp):
+    # The GetOpr table (partners and opponents with their quick-stats OPRs) for one team per event;
+    # building it scans every match of the event, so n counts matches scanned
+    n = 0
+    for matches in data['matches'].values():
+        team = matches[0]['teams'][0]['teamNumber']
+        for row in team_schedule(matches, team):
+            for column in ('Your Team', 'Partner', 'Opponent 1', 'Opponent 2'):
+                opr_of(data['quick_stats'].get(row[column]))
+        n += len(matches)
+    return n
+
+
+def stage_schedule_strength(data, tmp):
+    rows = match_team_rows(data['matches'])
+    oprs = pd.Series({team: stats['tot']['value'] for team, stats in data['quick_stats'].items()})
+    schedule_strength(rows, oprs)
+    return len(rows)
+
+
+def stage_snapshot(data, tmp):
+    tables = snapshot_tables(data['teams'], data['events'], data['participations'], data['matches'],
+                             data['quick_stats'])
+    path = os.path.join(tmp, "season.ftcsnap")
+    write_snapshot(path, tables, meta={'season': data['season']})
+    with SeasonSnapshot(path) as snapshot:
+        snapshot.team_events([t['number'] for t in data['teams'][:50]])
+    return sum(len(df) for df in tables.values())
+
+
+def stage_match_trends(data, tmp):
+    dates = {event['code']: event['start'] for event in data['events']}
+    trends = rolling_trends(match_series(match_team_rows(data['matches']), dates))
+    dashboard(trends)
+    return len(trends)
+
+
+def stage_ranking(data, tmp):
+    for matches in data['matches'].values():
+        QualificationRanking.from_matches(matches).qualification_points()
+    return sum(len(m) for m in data['matches'].values())
+
+
+# (name, stage, declared complexity as the exponent k in O(n^k))
+STAGES = [
+    ('normalize', stage_normalize, 1.0),
+    ('match rows', stage_match_rows, 1.0),
+    ('match table pdf', stage_match_table_pdf, 1.0),
+    ('opr schedule', stage_opr_schedule, 1.0),
+    ('co-occurrence', stage_co_occurrence, 1.0),
+    ('schedule strength', stage_schedule_strength, 1.0),
+    ('snapshot', stage_snapshot, 1.0),
+    ('match trends', stage_match_trends, 1.0),
+    ('ranking', stage_ranking, 1.0),
+]
+
+
+def measure(stage, data, tmp, repeat=1):
+    """Best wall time over `repeat` untraced runs, then one tracemalloc run for peak memory."""
+    seconds = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        n = stage(data, tmp)
+        seconds = min(seconds, time.perf_counter() - start)
+    # tracemalloc slows allocation-heavy code several times over, so it never shares a run with the timer
+    tracemalloc.start()
+    stage(data, tmp)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return n, seconds, peak
+
+
+def fitted_exponent(ns, values):
+    ns, values = np.asarray(ns, float), np.asarray(values, float)
+    keep = values > 0
+    if len(np.unique(ns[keep])) < 2 or ns[keep].max() / ns[keep].min() < MIN_RANGE:
+        return None
+    return float(np.polyfit(np.log(ns[keep]), np.log(values[keep]), 1)[0])
+
+
+def run(scales, seed=0, repeat=1):
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in scales:
+            data = generate(**SCALES[scale], seed=seed)
+            for name, stage, bound in STAGES:
+                n, seconds, peak = measure(stage, data, tmp, repeat)
+                results.append({'scale': scale, 'stage': name, 'n': n, 'seconds': seconds, 'peak_mb': peak / 1e6})
+                print(f"{scale:>8} {name:<18} n={n:<8} {results[-1]['seconds']:8.3f}s {results[-1]['peak_mb']:8.1f} MB")
+    return results
+
+
+def check(results):
+    df = pd.DataFrame(results)
+    report, failures = [], []
+    for name, _, bound in STAGES:
+        rows = df[df['stage'] == name]
+        timed = rows[rows['seconds'] >= MIN_SECONDS]
+        time_k = fitted_exponent(timed['n'], timed['seconds'])
+        memory_k = fitted_exponent(rows['n'], rows['peak_mb'])
+        report.append({'stage': name, 'bound': bound, 'time_exponent': time_k, 'memory_exponent': memory_k})
+        for label, k in (('time', time_k), ('memory', memory_k)):
+            if k is not None and k > bound + TOLERANCE:
+                failures.append(f"{name}: {label} grows as n^{k:.2f}, bound is n^{bound:g}")
+    return report, failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scale/stress run of every pipeline stage on synthetic seasons")
+    parser.add_argument("--up-to", choices=SCALES, default='region', help="Largest scale to run (default region)")
+    parser.add_argument("--seed", type=int, default=0, help="Generator seed (default 0)")
+    parser.add_argument("--repeat", type=int, default=1, help="Timed runs per stage, best one kept (default 1)")
+    parser.add_argument("--out", help="Save measurements and fitted exponents as JSON")
+    args = parser.parse_args()
+
+    names = list(SCALES)
+    results = run(names[:names.index(args.up_to) + 1], args.seed, args.repeat)
+    report, failures = check(results)
+
+    print()
+    for row in report:
+        fmt = lambda k: "  n/a" if k is None else f"{k:5.2f}"  # n/a: too few sizes or too narrow a range
+        print(f"{row['stage']:<18} time n^{fmt(row['time_exponent'])}  memory n^{fmt(row['memory_exponent'])}"
+              f"  (bound n^{row['bound']:g})")
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump({'results': results, 'exponents': report, 'failures': failures}, f, indent=2)
+    if failures:
+        print()
+        for failure in failures:
+            print(f"❌ {failure}")
+        sys.exit(1)
+    print("\n✅ Every stage scales within its declared bound")
+
+
+if __name__ == "__main__":
+    main()
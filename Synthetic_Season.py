@@ -0,0 +1,191 @@
+import argparse
+import json
+import os
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+# Named scales for generate(); a 10k-team season roughly matches a full FTC season
+SCALES = {
+    'event': dict(teams=30, events=1, teams_per_event=30, matches_per_team=5),
+    'league': dict(teams=300, events=12, teams_per_event=36, matches_per_team=5),
+    'region': dict(teams=1500, events=60, teams_per_event=45, matches_per_team=5),
+    'season': dict(teams=10000, events=400, teams_per_event=60, matches_per_team=6),
+}
+CITIES = ["Bucharest", "Cluj", "Iasi", "Timisoara", "Brasov", "Constanta", "Seattle", "Austin", "Denver", "Ottawa"]
+WORDS = ["Robo", "Gear", "Bolt", "Circuit", "Titan", "Nova", "Pixel", "Quantum", "Spark", "Vortex", "Byte", "Forge"]
+
+
+def _team_name(rng):
+    return f"{rng.choice(WORDS)}{rng.choice(WORDS).lower()} {rng.choice(['Robotics', 'Bots', 'Engineering', 'Lab'])}"
+
+
+def generate(teams=30, events=1, teams_per_event=30, matches_per_team=5, season=2024, seed=0):
+    """
+    Deterministic ftcscout-shaped season. Returns a dict with
+    teams, events, matches (by event code), participations and quick_stats (by team number).
+    Scores are drawn from a hidden per-team strength so OPR-style metrics have signal.
+    """
+    rng = np.random.default_rng(seed)
+    numbers = np.sort(rng.choice(np.arange(1, max(30000, teams * 3)), size=teams, replace=False))
+    auto_strength = rng.gamma(4.0, 5.0, teams)
+    dc_strength = rng.gamma(4.0, 15.0, teams)
+    strength_of = {int(n): i for i, n in enumerate(numbers)}
+
+    team_list = [{
+        'number': int(n), 'name': _team_name(rng), 'schoolName': None,
+        'city': str(rng.choice(CITIES)), 'state': None, 'country': "Romania" if n % 2 else "USA",
+        'rookieYear': int(rng.integers(2005, season + 1)),
+    } for n in numbers]
+
+    start = datetime(season, 10, 1, tzinfo=timezone.utc)
+    event_list, matches_by_event, participations = [], {}, []
+    for e in range(events):
+        code = f"SYN{season % 100:02d}{e:04d}"
+        day = start + timedelta(days=int(e * 180 / max(events, 1)))
+        event_list.append({'season': season, 'code': code, 'name': f"Synthetic Qualifier {e + 1}",
+                           'type': "Qualifier", 'regionCode': "SYN", 'start': day.date().isoformat(),
+                           'end': day.date().isoformat(), 'city': str(rng.choice(CITIES))})
+        size = min(teams_per_event, teams)
+        attending = rng.choice(numbers, size=size, replace=False)
+        matches, results = _event_matches(rng, code, season, attending, matches_per_team,
+                                          auto_strength, dc_strength, strength_of)
+        matches_by_event[code] = matches
+        participations.extend(_participations(code, season, attending, results, day))
+
+    quick_stats = {}
+    order = {key: np.argsort(-values) for key, values in (('auto', auto_strength), ('dc', dc_strength),
+                                                           ('tot', auto_strength + dc_strength))}
+    ranks = {key: np.empty(teams, dtype=int) for key in order}
+    for key, idx in order.items():
+        ranks[key][idx] = np.arange(1, teams + 1)
+    for i, n in enumerate(numbers):
+        values = {'auto': auto_strength[i], 'dc': dc_strength[i], 'tot': auto_strength[i] + dc_strength[i]}
+        quick_stats[int(n)] = {'season': season, 'number': int(n), 'count': teams,
+                               **{key: {'value': float(values[key]), 'rank': int(ranks[key][i])} for key in values}}
+
+    return {'season': season, 'teams': team_list, 'events': event_list, 'matches': matches_by_event,
+            'participations': participations, 'quick_stats': quick_stats}
+
+
+def _event_matches(rng, code, season, attending, matches_per_team, auto_strength, dc_strength, strength_of):
+    n_matches = max(1, -(-len(attending) * matches_per_team // 4))
+    # Cycle through shuffled rounds so every team plays matches_per_team times (plus surrogates to fill)
+    slots = np.concatenate([rng.permutation(attending) for _ in range(-(-n_matches * 4 // len(attending)))])
+    # Appearances past matches_per_team are surrogates; move them so no alliance has more than one
+    required, used = len(attending) * matches_per_team, n_matches * 4
+    surrogates = [m * 4 + station for m in range(n_matches - 1, -1, -1) for station in (3, 1)][:used - required]
+    extras = range(required, used)
+    for extra, target in zip(sorted(set(extras) - set(surrogates)), sorted(set(surrogates) - set(extras))):
+        slots[[extra, target]] = slots[[target, extra]]
+    surrogates = set(surrogates)
+    _split_repeats(slots[:used], surrogates)
+    matches, results = [], {int(t): [] for t in attending}
+    for m in range(n_matches):
+        four = slots[m * 4:m * 4 + 4]
+        teams, scores = [], {}
+        for offset, side, alliance in ((0, four[:2], 'Red'), (2, four[2:], 'Blue')):
+            idx = [strength_of[int(t)] for t in side]
+            auto = max(0, int(round(auto_strength[idx].sum() + rng.normal(0, 6))))
+            dc = max(0, int(round(dc_strength[idx].sum() + rng.normal(0, 15))))
+            penalty = int(rng.choice([0, 0, 0, 5, 10]))
+            scores[alliance.lower()] = {'season': season, 'alliance': alliance, 'autoPoints': auto, 'dcPoints': dc,
+                                        'penaltyPointsCommitted': 0, 'totalPointsNp': auto + dc,
+                                        'totalPoints': auto + dc + penalty}
+            for station, t in enumerate(side, start=1):
+                surrogate = m * 4 + offset + station - 1 in surrogates
+                teams.append({'season': season, 'eventCode': code, 'matchId': m + 1, 'alliance': alliance,
+                              'station': f"{'One' if station == 1 else 'Two'}", 'teamNumber': int(t),
+                              'surrogate': surrogate, 'noShow': False, 'dq': False, 'onField': True})
+        red, blue = scores['red']['totalPoints'], scores['blue']['totalPoints']
+        for team in teams:
+            mine, theirs = (red, blue) if team['alliance'] == 'Red' else (blue, red)
+            if not team['surrogate']:
+                results[team['teamNumber']].append((mine, theirs, scores[team['alliance'].lower()]))
+        matches.append({'season': season, 'eventCode': code, 'id': m + 1, 'matchNum': m + 1,
+                        'tournamentLevel': "Quals", 'hasBeenPlayed': True, 'series': 0,
+                        'teams': teams, 'scores': {'season': season, 'eventCode': code, 'matchId': m + 1, **scores}})
+    return matches, results
+
+
+def _split_repeats(slots, surrogates):
+    """
+    A match straddling two shuffled rounds can hold the same team twice. Swap the
+    repeat with a slot in another match (regular with regular, surrogate with
+    surrogate) that leaves both matches with four different teams; swaps keep every
+    team's appearance count.
+    """
+    for m in range(len(slots) // 4):
+        for i in range(m * 4, m * 4 + 4):
+            if slots[i] not in slots[m * 4:i]:
+                continue
+            for j in list(range(m * 4 + 4, len(slots))) + list(range(m * 4)):
+                other = j // 4 * 4
+                if ((j in surrogates) == (i in surrogates) and slots[j] not in slots[m * 4:m * 4 + 4]
+                        and slots[i] not in np.delete(slots[other:other + 4], j - other)):
+                    slots[[i, j]] = slots[[j, i]]
+                    break
+
+
+def _participations(code, season, attending, results, day):
+    rows = []
+    for t in attending:
+        played = results[int(t)]
+        wins = sum(mine > theirs for mine, theirs, _ in played)
+        ties = sum(mine == theirs for mine, theirs, _ in played)
+        n = max(len(played), 1)
+        rows.append({
+            'season': season, 'eventCode': code, 'teamNumber': int(t),
+            'createdAt': day.isoformat(), 'updatedAt': (day + timedelta(hours=8)).isoformat(),
+            'stats': {
+                'rank': None, 'rp': (2 * wins + ties) / n, 'tb1': sum(s['autoPoints'] for _, _, s in played) / n,
+                'wins': wins, 'losses': len(played) - wins - ties, 'ties': ties, 'qualMatchesPlayed': len(played),
+                'avg': {'totalPoints': sum(m for m, _, _ in played) / n,
+                        'autoPoints': sum(s['autoPoints'] for _, _, s in played) / n,
+                        'dcPoints': sum(s['dcPoints'] for _, _, s in played) / n},
+            },
+        })
+    # Same order as Ranking_Engine: ranking score, average auto, average teleop, team number
+    rows.sort(key=lambda r: (-r['stats']['rp'], -r['stats']['tb1'], -r['stats']['avg']['dcPoints'], r['teamNumber']))
+    for rank, row in enumerate(rows, start=1):
+        row['stats']['rank'] = rank
+    return rows
+
+
+def fixtures(data):
+    """REST path -> payload map for Backfill.FixtureServer."""
+    season = data['season']
+    routes = {f"/events/search/{season}": data['events']}
+    by_team = {}
+    for p in data['participations']:
+        by_team.setdefault(p['teamNumber'], []).append(p)
+        routes.setdefault(f"/events/{season}/{p['eventCode']}/teams", []).append(p)
+    for code, matches in data['matches'].items():
+        routes[f"/events/{season}/{code}/matches"] = matches
+    for team in data['teams']:
+        routes[f"/teams/{team['number']}"] = team
+        routes[f"/teams/{team['number']}/events/{season}"] = by_team.get(team['number'], [])
+    for number, stats in data['quick_stats'].items():
+        routes[f"/teams/{number}/quick-stats?season={season}"] = stats
+    return routes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a deterministic synthetic ftcscout season")
+    parser.add_argument("--scale", choices=SCALES, default='event', help="Preset size (default event)")
+    parser.add_argument("--season", type=int, default=2024, help="Season year (default 2024)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default 0)")
+    parser.add_argument("--out", default="synthetic_season", help="Output directory")
+    args = parser.parse_args()
+
+    data = generate(**SCALES[args.scale], season=args.season, seed=args.seed)
+    os.makedirs(args.out, exist_ok=True)
+    for key in ('teams', 'events', 'matches', 'participations', 'quick_stats'):
+        with open(os.path.join(args.out, f"{key}.json"), "w") as f:
+            json.dump(data[key], f)
+    n_matches = sum(len(m) for m in data['matches'].values())
+    print(f"\n✅ {len(data['teams'])} teams, {len(data['events'])} events, {n_matches} matches saved to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
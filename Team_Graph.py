@@ -0,0 +1,145 @@
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from Ftc_stats import get_season_matches
+
+# Per-edge counters, in column order of TeamGraph.counts
+COUNT_COLUMNS = ('partner', 'opponent', 'wins_together', 'losses_together')
+
+
+def match_results(matches_by_event):
+    """Flatten match payloads to one row per (event, match, team) with that alliance's result."""
+    rows = []
+    for event_code, matches in matches_by_event.items():
+        for match in matches:
+            scores = match.get('scores') or {}
+            red = (scores.get('red') or {}).get('totalPoints')
+            blue = (scores.get('blue') or {}).get('totalPoints')
+            for team in match.get('teams', []):
+                alliance = team['alliance']
+                if red is None or blue is None:
+                    result = ''
+                else:
+                    mine, theirs = (red, blue) if alliance == 'Red' else (blue, red)
+                    result = 'W' if mine > theirs else 'L' if mine < theirs else 'T'
+                rows.append((event_code, match.get('id', match.get('matchNum')), team['teamNumber'], alliance, result))
+    return pd.DataFrame(rows, columns=['event', 'match', 'team', 'alliance', 'result'])
+
+
+class TeamGraph:
+    """
+    Season-wide partner/opponent co-occurrence index stored as CSR arrays.
+    Neighbours of teams[i] are indices[indptr[i]:indptr[i+1]] (sorted team numbers),
+    with per-edge counts and shared event codes alongside.
+    """
+
+    def __init__(self, teams, indptr, indices, counts, event_indptr, event_ids, events):
+        self.teams = teams
+        self.indptr = indptr
+        self.indices = indices
+        self.counts = counts
+        self.event_indptr = event_indptr
+        self.event_ids = event_ids
+        self.events = events
+
+    @classmethod
+    def from_matches(cls, matches_by_event):
+        rows = match_results(matches_by_event)
+        pairs = rows.merge(rows, on=['event', 'match'])
+        pairs = pairs[pairs['team_x'] != pairs['team_y']]
+        partner = pairs['alliance_x'] == pairs['alliance_y']
+        events = np.array(sorted(rows['event'].unique()), dtype=str)
+        edges = pd.DataFrame({
+            'a': pairs['team_x'].to_numpy(np.int64),
+            'b': pairs['team_y'].to_numpy(np.int64),
+            'partner': partner.to_numpy(np.int32),
+            'opponent': (~partner).to_numpy(np.int32),
+            'wins_together': (partner & (pairs['result_x'] == 'W')).to_numpy(np.int32),
+            'losses_together': (partner & (pairs['result_x'] == 'L')).to_numpy(np.int32),
+            'event': np.searchsorted(events, pairs['event'].to_numpy(str)).astype(np.int32),
+        })
+        grouped = edges.groupby(['a', 'b'], sort=True)
+        counts = grouped[list(COUNT_COLUMNS)].sum()
+        shared = edges.drop_duplicates(['a', 'b', 'event']).sort_values(['a', 'b', 'event'])
+
+        pair_index = counts.index
+        a = pair_index.get_level_values('a').to_numpy(np.int64)
+        teams = np.unique(a)
+        indptr = np.searchsorted(a, teams, side='left')
+        indptr = np.append(indptr, len(a)).astype(np.int64)
+        per_edge = shared.groupby(['a', 'b'], sort=True).size().to_numpy(np.int64)
+        event_indptr = np.concatenate([[0], np.cumsum(per_edge)]).astype(np.int64)
+        return cls(
+            teams=teams,
+            indptr=indptr,
+            indices=pair_index.get_level_values('b').to_numpy(np.int64),
+            counts=counts.to_numpy(np.int32),
+            event_indptr=event_indptr,
+            event_ids=shared['event'].to_numpy(np.int32),
+            events=events,
+        )
+
+    def save(self, path):
+        np.savez_compressed(path, teams=self.teams, indptr=self.indptr, indices=self.indices, counts=self.counts,
+                            event_indptr=self.event_indptr, event_ids=self.event_ids, events=self.events)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as data:
+            return cls(**{key: data[key] for key in data.files})
+
+    def _edge_range(self, team):
+        i = np.searchsorted(self.teams, team)
+        if i == len(self.teams) or self.teams[i] != team:
+            return 0, 0
+        return self.indptr[i], self.indptr[i + 1]
+
+    def _edge(self, edge):
+        record = dict(zip(COUNT_COLUMNS, self.counts[edge].tolist()))
+        record['events'] = self.events[self.event_ids[self.event_indptr[edge]:self.event_indptr[edge + 1]]].tolist()
+        return record
+
+    def pair(self, team, other):
+        start, stop = self._edge_range(team)
+        j = start + np.searchsorted(self.indices[start:stop], other)
+        if j == stop or self.indices[j] != other:
+            return None
+        return self._edge(j)
+
+    def neighbours(self, team):
+        start, stop = self._edge_range(team)
+        return {int(self.indices[edge]): self._edge(edge) for edge in range(start, stop)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Season partner/opponent co-occurrence index")
+    sub = parser.add_subparsers(dest='command', required=True)
+    build = sub.add_parser('build', help="Fetch every match of a season and build the index")
+    build.add_argument("--year", required=True, help="Season year (e.g. 2024)")
+    build.add_argument("--out", help="Index file (default Team_Graph_<year>.npz)")
+    query = sub.add_parser('query', help="Look up a team's neighbourhood or a team pair")
+    query.add_argument("--index", required=True, help="Index file written by build")
+    query.add_argument("--team", type=int, required=True, help="Team number")
+    query.add_argument("--with", type=int, dest='other', help="Second team number")
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        graph = TeamGraph.from_matches(get_season_matches(args.year))
+        out = args.out or f"Team_Graph_{args.year}.npz"
+        graph.save(out)
+        print(f"\n✅ Indexed {len(graph.teams)} teams, {len(graph.indices)} pairs into {out}")
+        return
+
+    graph = TeamGraph.load(args.index)
+    if args.other is not None:
+        print(graph.pair(args.team, args.other) or f"Teams {args.team} and {args.other} never met")
+        return
+    df = pd.DataFrame.from_dict(graph.neighbours(args.team), orient='index')
+    pd.set_option('display.max_rows', None)
+    print(df.sort_values(by=['partner', 'opponent'], ascending=False) if not df.empty else f"No matches for team {args.team}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+import argparse
+import bisect
+import json
+import os
+import re
+import time
+import unicodedata
+from collections import defaultdict
+
+import numpy as np
+
+INDEX_FILE = "Team_Search_Index.json"
+FIELDS = ('number', 'name', 'city', 'state', 'country', 'rookieYear')
+
+
+def normalize(text):
+    text = unicodedata.normalize('NFKD', str(text or "")).encode('ascii', 'ignore').decode()
+    return re.sub(r"[^a-z0-9]+", " ", text.lower()).strip()
+
+
+def trigrams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TeamSearch:
+    """
+    Offline team lookup by number, name or city.
+
+    Prefix lookups are binary searches over a sorted key list; fuzzy lookups score
+    candidates by shared trigrams using NumPy posting arrays. Records can be added
+    or replaced one at a time without rebuilding the index.
+    """
+
+    def __init__(self, teams=()):
+        self.records = []
+        self.by_number = {}
+        self._postings = defaultdict(set)
+        self._arrays = {}
+        self._names = []
+        self._keys = []
+        self.update(teams)
+
+    def __len__(self):
+        return len(self.records)
+
+    # === BUILD / REFRESH ===
+    def _grams(self, record):
+        return trigrams(f"{normalize(record.get('name'))} {normalize(record.get('city'))}")
+
+    def _record_keys(self, i):
+        record, name = self.records[i], self._names[i]
+        keys = [(str(record['number']), i), (name, i), (normalize(record['city']), i)]
+        keys.extend((word, i) for word in name.split()[1:])
+        return keys
+
+    def update(self, teams):
+        """Add new teams and replace changed ones; returns how many records changed."""
+        teams = list(teams)
+        # A handful of changes are spliced into the sorted keys; a bulk load sorts once at the end
+        incremental = len(teams) < 1000 and bool(self._keys)
+        changed = 0
+        for team in teams:
+            record = {field: team.get(field) for field in FIELDS}
+            i = self.by_number.get(record['number'])
+            if i is not None:
+                if self.records[i] == record:
+                    continue
+                for gram in self._grams(self.records[i]):
+                    self._postings[gram].discard(i)
+                    self._arrays.pop(gram, None)
+                if incremental:
+                    for key in self._record_keys(i):
+                        del self._keys[bisect.bisect_left(self._keys, key)]
+                self.records[i] = record
+                self._names[i] = normalize(record['name'])
+            else:
+                i = self.by_number[record['number']] = len(self.records)
+                self.records.append(record)
+                self._names.append(normalize(record['name']))
+            for gram in self._grams(record):
+                self._postings[gram].add(i)
+                self._arrays.pop(gram, None)
+            if incremental:
+                for key in self._record_keys(i):
+                    bisect.insort(self._keys, key)
+            changed += 1
+        if changed and not incremental:
+            self._keys = sorted(key for i in range(len(self.records)) for key in self._record_keys(i))
+        return changed
+
+    def refresh(self):
+        from Ftc_stats import search_teams  # Ftc_stats prompts through this module
+        return self.update(search_teams())
+
+    def save(self, path=INDEX_FILE):
+        with open(path, "w") as f:
+            json.dump(self.records, f)
+
+    @classmethod
+    def load(cls, path=INDEX_FILE):
+        with open(path) as f:
+            return cls(json.load(f))
+
+    # === LOOKUP ===
+    def prefix(self, text, limit=10):
+        key = normalize(text)
+        if not key:
+            return []
+        keys = self._keys
+        found = {}
+        for j in range(bisect.bisect_left(keys, (key, -1)), len(keys)):
+            # Enough candidates to rank; a one-letter prefix should not walk the whole index
+            if not keys[j][0].startswith(key) or len(found) >= limit * 20:
+                break
+            found.setdefault(keys[j][1])
+        found = list(found)
+        # Shorter keys first: an exact "1234" or "titan" beats "12345" or "titanium"
+        found.sort(key=lambda i: (str(self.records[i]['number']) != key, len(self._names[i])))
+        return [self.records[i] for i in found[:limit]]
+
+    def _posting(self, gram):
+        array = self._arrays.get(gram)
+        if array is None:
+            array = self._arrays[gram] = np.fromiter(self._postings.get(gram, ()), dtype=np.int32)
+        return array
+
+    def fuzzy(self, text, limit=10, min_score=0.3):
+        grams = trigrams(normalize(text))
+        if not grams or not self.records:
+            return []
+        hits = np.bincount(np.concatenate([self._posting(gram) for gram in grams]), minlength=len(self.records))
+        best = np.flatnonzero(hits >= max(1, min_score * len(grams)))
+        best = best[np.argsort(-hits[best], kind='stable')][:limit]
+        return [{**self.records[i], 'score': round(float(hits[i]) / len(grams), 2)} for i in best]
+
+    def search(self, text, limit=10):
+        """Prefix matches first, then fuzzy matches not already listed."""
+        results = self.prefix(text, limit)
+        seen = {r['number'] for r in results}
+        results += [r for r in self.fuzzy(text, limit) if r['number'] not in seen]
+        return results[:limit]
+
+
+# === INTERACTIVE PROMPTS ===
+_default_index = None
+
+
+def default_index():
+    global _default_index
+    if _default_index is None and os.path.exists(INDEX_FILE):
+        _default_index = TeamSearch.load(INDEX_FILE)
+    return _default_index
+
+
+def ask_team(prompt="Enter team ID or name: ", index=None):
+    """
+    Prompt for a team by number or (with a saved index) by name or city.
+    Returns the team number as an int.
+    """
+    index = index or default_index()
+    while True:
+        answer = input(prompt).strip()
+        if answer.isdigit() and (index is None or int(answer) in index.by_number or not index.prefix(answer)):
+            return int(answer)
+        if index is None:
+            print("Please enter a team number (run Team_Search.py refresh to search by name).")
+            continue
+        matches = index.search(answer)
+        if not matches:
+            print(f"No team matches '{answer}'.")
+            continue
+        for n, team in enumerate(matches):
+            print(f"{n:>2}  {team['number']:>6}  {team['name']}  ({team['city'] or '?'}, rookie {team['rookieYear']})")
+        choice = input("Select a team index from above (Enter to search again): ").strip()
+        if choice.isdigit() and int(choice) < len(matches):
+            return int(matches[int(choice)]['number'])
+
+
+def ask_teams(prompt="Enter team IDs or names separated by commas: ", index=None):
+    """Several teams on one line; names resolve to their best match, which is echoed back."""
+    index = index or default_index()
+    numbers = []
+    for part in input(prompt).split(","):
+        tokens = part.split()
+        # Numbers may still be separated by spaces ("6 7"); only names need commas
+        for item in tokens if index is None or all(t.isdigit() for t in tokens) else [part.strip()]:
+            if item.isdigit():
+                numbers.append(int(item))
+                continue
+            best = index.search(item, 1) if index else []
+            if best:
+                print(f"  {item} -> {best[0]['number']} {best[0]['name']}")
+                numbers.append(int(best[0]['number']))
+            else:
+                print(f"  {item}: no matching team, skipped")
+    return numbers
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline fuzzy search over FTC teams")
+    sub = parser.add_subparsers(dest='command', required=True)
+    refresh = sub.add_parser('refresh', help="Fetch the team list and update the index")
+    refresh.add_argument("--index", default=INDEX_FILE, help=f"Index file (default {INDEX_FILE})")
+    search = sub.add_parser('search', help="Look up teams by number, name or city")
+    search.add_argument("text", help="Number, name or city (typos are fine)")
+    search.add_argument("--index", default=INDEX_FILE, help=f"Index file (default {INDEX_FILE})")
+    search.add_argument("--limit", type=int, default=10, help="Maximum results (default 10)")
+    args = parser.parse_args()
+
+    if args.command == 'refresh':
+        index = TeamSearch.load(args.index) if os.path.exists(args.index) else TeamSearch()
+        changed = index.refresh()
+        index.save(args.index)
+        print(f"\n✅ {changed} teams added or updated, {len(index)} teams in {args.index}")
+        return
+
+    index = TeamSearch.load(args.index)
+    start = time.perf_counter()
+    results = index.search(args.text, args.limit)
+    elapsed = (time.perf_counter() - start) * 1000
+    for team in results:
+        print(f"{team['number']:>6}  {team['name']}  ({team['city'] or '?'}, rookie {team['rookieYear']})")
+    print(f"\n{len(results)} matches in {elapsed:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()